@@ -29,7 +29,7 @@ if __name__ == "__main__":
             driver.tips_off(plate_location=9)  # Should show purple glow at position 9
 
             state = driver.get_simulation_state()
-            print(f"Remaining liquid: {state['liquid_volume']}")
+            print(f"Remaining liquid: {state.liquid_volume}")
 
     except Exception as e:
         logging.error(f"Error: {e}")
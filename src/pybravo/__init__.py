@@ -1,12 +1,27 @@
 __version__ = "0.1.0"
 __author__ = "Silvio Ortiz Aburto"
 
-from .core import BravoDriver
-from .exceptions import BravoError, BravoConnectionError, BravoCommandError
+from .exceptions import (
+    BravoError,
+    BravoConnectionError,
+    BravoCommandError,
+    BravoTimeoutError,
+)
 
 __all__ = [
     "BravoDriver",
+    "BravoDriverPool",
     "BravoError",
     "BravoConnectionError",
     "BravoCommandError",
+    "BravoTimeoutError",
 ]
+
+
+def __getattr__(name):
+    # Import the driver lazily so `import pybravo` stays cheap
+    if name in ("BravoDriver", "BravoDriverPool"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,194 +1,815 @@
 import os
+import sys
+import time
+import atexit
+import queue
 import logging
 import threading
-from typing import Optional, Dict, Any, Callable, TypeVar, List
-from functools import wraps
-import pythoncom
-import clr
+import weakref
+from collections import deque
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    TypeVar,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+)
+from functools import partial, wraps
+from types import MappingProxyType
 from .utils import is_admin
-from .state import BravoDeckState, OperationStatus, LabwareType
-
-# Handle imports
-try:
-    from .exceptions import BravoConnectionError, BravoCommandError
-except ImportError:
+from .state import BravoDeckState, LabwareType, OperationStatus
+from .exceptions import BravoConnectionError, BravoCommandError, BravoTimeoutError
 
-    class BravoConnectionError(Exception):
-        pass
+# Module __file__ paths are already absolute, so this is string work only;
+# whether the DLLs exist is checked when the SDK is loaded
+_DLL_DIR = os.path.join(os.path.dirname(__file__), "DLLs")
+SDK_DLL = os.path.join(_DLL_DIR, "AxInterop.HomewoodLib.dll")
+INTEROP_DLL = os.path.join(_DLL_DIR, "Interop.HomewoodLib.dll")
 
-    class BravoCommandError(Exception):
-        pass
+# The COM and .NET bridges are only needed to talk to hardware, so they are
+# imported on first connect rather than at module import
+pythoncom: Any = None
+win32event: Any = None
+AxHomewood: Any = None
 
+T = TypeVar("T")
 
-SDK_DLL = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    "DLLs",
-    "AxInterop.HomewoodLib.dll",
+# Canned simulation responses, shared read-only instead of rebuilt per call
+_SIM_VERSION = "SIMULATION_VERSION_1.0.0"
+_SIM_PROFILES = ("Default", "Profile1", "Profile2")
+_SIM_DEVICE_CONFIGURATION = MappingProxyType(
+    {"simulation": True, "config": "mock_config"}
 )
 
-if not os.path.exists(SDK_DLL):
-    raise FileNotFoundError(f"Bravo SDK DLL not found at {SDK_DLL}")
+# Simulated return value per COM method; methods not listed return None
+_SIM_RESPONSES: Dict[str, Any] = {
+    "get_activex_version": _SIM_VERSION,
+    "get_firmware_version": _SIM_VERSION,
+    "get_hardware_version": _SIM_VERSION,
+    "enumerate_profiles": _SIM_PROFILES,
+    "get_last_error": "No errors in simulation",
+    "get_device_configuration": _SIM_DEVICE_CONFIGURATION,
+    "get_labware_at_location": 1,  # Mock labware type
+}
 
-print(f"Loading Bravo SDK from {SDK_DLL}")
-clr.AddReference(SDK_DLL)
+# Simulated commands kept for get_simulation_commands(); older ones are
+# dropped so long simulated runs don't grow without bound
+SIM_COMMAND_HISTORY = 10_000
 
-from AxHomewoodLib import AxHomewood  # type: ignore
+logger = logging.getLogger(__name__)
 
-T = TypeVar("T")
 
+def _load_pythoncom() -> None:
+    """Import pythoncom (and win32event for the STA wait loop) on first use"""
+    global pythoncom, win32event
+    if pythoncom is None:
+        import pythoncom as _pythoncom
+        import win32event as _win32event
 
-class STAComManager:
-    """Context manager for STA COM operations"""
+        pythoncom = _pythoncom
+        win32event = _win32event
 
-    def __enter__(self):
-        pythoncom.CoInitialize()
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pythoncom.CoUninitialize()
+def _load_sdk() -> None:
+    """Load pythoncom, the CLR bridge and the Bravo SDK assembly once"""
+    global AxHomewood
+    if AxHomewood is not None:
+        return
+
+    _load_pythoncom()
+    import clr
+    from System.IO import FileNotFoundException  # type: ignore
+
+    logger.debug("Loading Bravo SDK from %s", SDK_DLL)
+    try:
+        clr.AddReference(SDK_DLL)
+    except FileNotFoundException as e:
+        raise FileNotFoundError(f"Bravo SDK DLL not found at {SDK_DLL}") from e
+
+    from AxHomewoodLib import AxHomewood as _AxHomewood  # type: ignore
+
+    AxHomewood = _AxHomewood
+
+
+def _array_to_list(value: Any) -> Any:
+    """Copy a .NET array returned by the SDK into a Python list
+
+    Arrays of primitives are copied in one go through the buffer protocol;
+    other arrays (e.g. of strings) fall back to iteration. Scalars and
+    strings are returned unchanged.
+    """
+    if (
+        value is None
+        or isinstance(value, (str, bytes))
+        or not hasattr(value, "__len__")
+    ):
+        return value
+    try:
+        return memoryview(value).tolist()
+    except TypeError:
+        return list(value)
+
+
+def _ocx_interface(client: Any) -> Any:
+    """Return the control's underlying _DHomewood interface, or None
+
+    Calls made on it go straight to the ActiveX object instead of through
+    the AxHost forwarding wrapper.
+    """
+    try:
+        import clr
+
+        clr.AddReference(INTEROP_DLL)
+        from HomewoodLib import _DHomewood  # type: ignore
+
+        return _DHomewood(client.GetOcx())
+    except Exception as e:
+        logger.debug("Direct OCX interface unavailable, using AxHomewood: %s", e)
+        return None
+
+
+class _StaWorker:
+    """Long-lived STA thread that owns the COM control and runs all calls on it
+
+    COM is initialized once when the thread starts. Work is handed over
+    through a queue; while idle the thread sleeps in
+    MsgWaitForMultipleObjects, so it wakes for either new work or incoming
+    window messages, and messages are pumped after every job so COM
+    callbacks are never held up. The control must only be used from this
+    thread; other threads go through the driver methods or submit_async.
+
+    Urgent jobs (abort) go in a separate slot that is served before queued
+    work, and also while a non-blocking command waits for its Complete
+    event, so they never wait behind the command in flight.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_urgent",
+        "_wake",
+        "_thread",
+        "_started",
+        "_start_error",
+        "_stopped",
+        "ident",
+    )
+
+    def __init__(self, name: str = "BravoSTA") -> None:
+        self._queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._urgent: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        # Auto-reset event signalled whenever a job is queued
+        self._wake = win32event.CreateEvent(None, False, False, None)
+        self._started = threading.Event()
+        self._start_error: Optional[BaseException] = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self.ident = self._thread.ident
+
+        # Don't hand out a worker whose apartment failed to initialize;
+        # jobs queued on it would never run
+        self._started.wait()
+        if self._start_error is not None:
+            raise BravoConnectionError(
+                f"Failed to initialize COM on the STA thread: {self._start_error}"
+            ) from self._start_error
+
+    def _run(self) -> None:
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        except BaseException as e:
+            self._start_error = e
+            return
+        finally:
+            self._started.set()
+
+        try:
+            while True:
+                self.run_urgent()
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    self.pump(win32event.INFINITE)
+                    continue
+
+                if job is None:
+                    break
+
+                self._run_job(job)
+                pythoncom.PumpWaitingMessages()
+        finally:
+            # Jobs that raced in behind the stop sentinel will never run
+            for pending in (self._urgent, self._queue):
+                while True:
+                    try:
+                        job = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is not None:
+                        job[3].cancel()
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _run_job(job: tuple) -> None:
+        fn, args, kwargs, future = job
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def pump(self, timeout_ms: int) -> None:
+        """Sleep until new work, a window message or the timeout, then pump
+
+        Only called on the STA thread.
+        """
+        win32event.MsgWaitForMultipleObjects(
+            (self._wake,), False, timeout_ms, win32event.QS_ALLINPUT
+        )
+        pythoncom.PumpWaitingMessages()
+
+    def run_urgent(self) -> None:
+        """Run every pending urgent job; only called on the STA thread"""
+        while True:
+            try:
+                job = self._urgent.get_nowait()
+            except queue.Empty:
+                return
+            self._run_job(job)
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """Queue a call on the STA thread and return its Future"""
+        if self._stopped:
+            raise BravoConnectionError("Bravo STA worker has been stopped")
+        future: "Future[T]" = Future()
+        self._queue.put((fn, args, kwargs, future))
+        win32event.SetEvent(self._wake)
+        return future
+
+    def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a call on the STA thread and wait for its result"""
+        if threading.get_ident() == self.ident:
+            # Already on the STA thread (e.g. nested driver calls)
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def call_urgent(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a call on the STA thread ahead of queued work and wait for it
+
+        While a non-blocking command is waiting for its Complete event the
+        call runs in between message pumps, without waiting for the command.
+        """
+        if threading.get_ident() == self.ident:
+            return fn(*args, **kwargs)
+        if self._stopped:
+            raise BravoConnectionError("Bravo STA worker has been stopped")
+        future: "Future[T]" = Future()
+        self._urgent.put((fn, args, kwargs, future))
+        win32event.SetEvent(self._wake)
+        return future.result()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish queued work, then uninitialize COM and end the thread"""
+        self._stopped = True
+        if self._thread.is_alive():
+            self._queue.put(None)
+            win32event.SetEvent(self._wake)
+            if threading.get_ident() != self.ident:
+                self._thread.join(timeout)
 
 
 def sta_com_method(func: Callable[..., T]) -> Callable[..., T]:
-    """Decorator to ensure COM method runs in STA context"""
+    """Decorator to run a COM method on the driver's STA worker thread
+
+    The worker already owns an initialized apartment, so no per-call COM
+    setup is done here. Without a worker (simulation) nothing touches COM
+    and the method runs directly.
+    """
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Check if in simulation mode
-        if hasattr(self, "simulation_mode") and self.simulation_mode:
-            logging.info(
-                f"SIMULATION: {func.__name__} called with args={args}, kwargs={kwargs}"
-            )
-            return None  # or return appropriate mock data
-
-        with STAComManager():
+        worker = self._worker
+        if worker is None:
             return func(self, *args, **kwargs)
+        return worker.call(func, self, *args, **kwargs)
 
     return wrapper
 
 
-def simulation_aware_method(func: Callable[..., T]) -> Callable[..., T]:
-    """Decorator for methods that should be simulation-aware"""
+# last_operation recorded in the simulated state per COM method
+_SIM_LAST_OPERATION = {
+    "mix": "mix",
+    "wash": "wash",
+    "move_to_location": "move",
+    "pick_and_place": "pick_and_place",
+    "pump_reagent": "pump_reagent",
+    "abort": "abort",
+}
+
+# Public COM methods that skip the STA worker's queue (see call_urgent)
+_URGENT_METHODS = frozenset({"abort"})
+
+
+def bravo_com(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator for public COM methods: simulate, or run on the STA worker
+
+    Combines the simulation short-circuit, the connection check, STA
+    dispatch and error wrapping in one wrapper. The simulated return value
+    and error label are resolved once, when the method is decorated.
+    """
+    # Private implementations (e.g. _abort) report under their public name
+    name = func.__name__.lstrip("_")
+    sim_result = _SIM_RESPONSES.get(name)
+    failure = f"Failed to {name.replace('_', ' ')}"
+    urgent = name in _URGENT_METHODS
+    sim_operation = _SIM_LAST_OPERATION.get(name)
+    # Optional _<name>_sim method that updates the simulated device state
+    sim_attr = f"_{name}_sim"
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         if self.simulation_mode:
-            logging.info(
-                f"SIMULATION: {func.__name__} called with args={args}, kwargs={kwargs}"
-            )
-            # Return mock data or perform simulation logic
-            return self._handle_simulation(func.__name__, *args, **kwargs)
-        return func(self, *args, **kwargs)
+            self._simulation_state.commands.append((name, args, kwargs))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "SIMULATION: %s called with args=%s, kwargs=%s", name, args, kwargs
+                )
+            if sim_operation is not None:
+                self._simulation_state.last_operation = sim_operation
+            simulate = getattr(self, sim_attr, None)
+            if simulate is not None:
+                simulate(*args, **kwargs)
+            return sim_result
+
+        if not self._ready:
+            raise BravoCommandError("Device not connected")
+        try:
+            # A ready hardware driver always has the STA worker that owns the
+            # control, so COM is never touched from the caller's apartment
+            if urgent:
+                return self._worker.call_urgent(func, self, *args, **kwargs)
+            return self._worker.call(func, self, *args, **kwargs)
+        except BravoCommandError:
+            raise
+        except Exception as e:
+            raise BravoCommandError(f"{failure}: {e}") from e
 
     return wrapper
 
 
+# Deck operation status recorded while each tracked command runs
+_TRACKED_OPERATIONS = {
+    "aspirate": OperationStatus.ASPIRATING,
+    "dispense": OperationStatus.DISPENSING,
+    "mix": OperationStatus.MIXING,
+    "wash": OperationStatus.WASHING,
+    "move_to_location": OperationStatus.MOVING,
+    "pick_and_place": OperationStatus.PICKING,
+    "pump_reagent": OperationStatus.PUMPING,
+}
+
+
 def state_tracking_method(func: Callable[..., T]) -> Callable[..., T]:
     """Decorator to track state changes for operations"""
+    name = func.__name__
+    operation = _TRACKED_OPERATIONS.get(name)
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         # Extract nest/plate location from arguments for state tracking
         nest_id = None
-        operation_details = {}
 
-        # Common parameter names for nest/location identification
-        for i, arg in enumerate(args):
-            if (
-                i == 1 and isinstance(arg, int) and 1 <= arg <= 9
-            ):  # plate_location is often 2nd arg
+        # plate_location is often the 2nd arg
+        if len(args) > 1:
+            arg = args[1]
+            if isinstance(arg, int) and 1 <= arg <= 9:
                 nest_id = arg
-                break
 
         # Check kwargs for location parameters
-        for param_name in ["plate_location", "nest_id", "location"]:
-            if param_name in kwargs:
-                nest_id = kwargs[param_name]
-                break
-
-        # Collect operation details from arguments
-        if hasattr(self, "_extract_operation_details"):
-            operation_details = self._extract_operation_details(
-                func.__name__, args, kwargs
-            )
+        if kwargs:
+            for param_name in ("plate_location", "nest_id", "location"):
+                if param_name in kwargs:
+                    nest_id = kwargs[param_name]
+                    break
+
+        deck_state = self.deck_state if nest_id else None
 
         # Start operation tracking
-        if nest_id and hasattr(self, "deck_state"):
-            operation_map = {
-                "aspirate": "aspirating",
-                "dispense": "dispensing",
-                "mix": "mixing",
-                "wash": "washing",
-                "move_to_location": "moving",
-                "pick_and_place": "picking",
-                "pump_reagent": "pumping",
-                "tips_on": "idle",
-                "tips_off": "idle",
-            }
-
-            operation = operation_map.get(func.__name__, "idle")
-            if operation != "idle":
-                self.deck_state.start_operation_at_nest(
-                    nest_id, operation, operation_details
-                )
+        if deck_state is not None and operation is not None:
+            deck_state.start_operation_at_nest(
+                nest_id,
+                operation,
+                self._extract_operation_details(name, args, kwargs),
+            )
 
         try:
             # Execute the original function
             result = func(self, *args, **kwargs)
 
             # Update state based on successful operation
-            if nest_id and hasattr(self, "deck_state"):
-                self._update_state_after_operation(func.__name__, nest_id, args, kwargs)
-                self.deck_state.complete_operation_at_nest(nest_id)
+            if deck_state is not None:
+                self._update_state_after_operation(name, nest_id, args, kwargs)
+                deck_state.complete_operation_at_nest(nest_id)
 
             return result
 
         except Exception as e:
             # Handle errors and update state
-            if nest_id and hasattr(self, "deck_state"):
-                self.deck_state.log_error(str(e), nest_id)
+            if deck_state is not None:
+                deck_state.log_error(str(e), nest_id)
             raise
 
     return wrapper
 
 
+class _SimState:
+    """Simulated device state (simulation mode only)"""
+
+    __slots__ = (
+        "current_position",
+        "tips_loaded",
+        "liquid_volume",
+        "last_operation",
+        "head_mode",
+        "liquid_class",
+        "tip_touch",
+        "labware",
+        "commands",
+    )
+
+    def __init__(self) -> None:
+        self.current_position: Dict[str, Any] = {"x": 0, "y": 0, "z": 0}
+        self.tips_loaded = False
+        self.liquid_volume = 0.0
+        self.last_operation: Optional[str] = None
+        self.head_mode: Optional[int] = None
+        self.liquid_class: Optional[str] = None
+        self.tip_touch: Optional[Dict[str, Any]] = None
+        # Labware type per plate location
+        self.labware: Dict[int, str] = {}
+        # The most recent simulated commands as (method name, args, kwargs)
+        self.commands: "deque[Tuple[str, tuple, dict]]" = deque(
+            maxlen=SIM_COMMAND_HISTORY
+        )
+
+    def snapshot(self) -> "SimStateSnapshot":
+        """Immutable copy of the current state"""
+        return SimStateSnapshot(
+            self.current_position.copy(),
+            self.tips_loaded,
+            self.liquid_volume,
+            self.last_operation,
+            self.head_mode,
+            self.liquid_class,
+            self.tip_touch,
+            self.labware.copy(),
+        )
+
+
+class SimStateSnapshot(NamedTuple):
+    """Point-in-time view of the simulated device state"""
+
+    current_position: Dict[str, Any]
+    tips_loaded: bool
+    liquid_volume: float
+    last_operation: Optional[str]
+    head_mode: Optional[int]
+    liquid_class: Optional[str]
+    tip_touch: Optional[Dict[str, Any]]
+    labware: Dict[int, str]
+
+
+class CommandBatch:
+    """Queue driver commands and run them together inside one STA scope
+
+    Commands are flushed when ``max_size`` commands are pending, when the
+    oldest pending command is older than ``wait`` seconds, when
+    ``should_execute`` returns True for a newly queued command, or when the
+    batch context exits.
+    """
+
+    # Commands that should never sit in the queue
+    URGENT_COMMANDS = frozenset({"home_w", "home_xyz", "abort"})
+
+    __slots__ = (
+        "_driver",
+        "max_size",
+        "wait",
+        "should_execute",
+        "_pending",
+        "_first_queued",
+        "results",
+    )
+
+    def __init__(
+        self,
+        driver: "BravoDriver",
+        max_size: int = 16,
+        wait: Optional[float] = None,
+        should_execute: Optional[Callable[[str, tuple, dict], bool]] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._driver = driver
+        self.max_size = max_size
+        self.wait = wait
+        self.should_execute = should_execute or self._is_urgent
+        self._pending: List[Tuple[str, tuple, dict]] = []
+        self._first_queued: Optional[float] = None
+        self.results: List[Any] = []
+
+    @classmethod
+    def _is_urgent(cls, name: str, args: tuple, kwargs: dict) -> bool:
+        return name in cls.URGENT_COMMANDS
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # Resolve eagerly so typos fail at the call site, not at flush time
+        if name.startswith("_") or not callable(getattr(self._driver, name)):
+            raise AttributeError(name)
+
+        def enqueue(*args, **kwargs) -> None:
+            self.add(name, *args, **kwargs)
+
+        return enqueue
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, name: str, *args, **kwargs) -> None:
+        """Queue a driver command by method name"""
+        if not self._pending:
+            self._first_queued = time.monotonic()
+        self._pending.append((name, args, kwargs))
+
+        if (
+            len(self._pending) >= self.max_size
+            or self.should_execute(name, args, kwargs)
+            or (
+                self.wait is not None
+                and time.monotonic() - self._first_queued >= self.wait
+            )
+        ):
+            self.flush()
+
+    def flush(self) -> List[Any]:
+        """Run all pending commands in a single STA scope"""
+        pending, self._pending = self._pending, []
+        self._first_queued = None
+        if not pending:
+            return []
+
+        results = self._driver.run_batch(pending)
+        self.results.extend(results)
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            # Don't run queued commands after a failure in the batch body
+            self._pending.clear()
+
+
+# COM methods bound once per control and cached on the driver as
+# (driver attribute, COM method name)
+_RAW_COM_METHODS = (
+    ("_aspirate_raw", "Aspirate"),
+    ("_dispense_raw", "Dispense"),
+    ("_mix_raw", "Mix"),
+    ("_wash_raw", "Wash"),
+    ("_tips_on_raw", "TipsOn"),
+    ("_tips_off_raw", "TipsOff"),
+    ("_move_to_location_raw", "MoveToLocation"),
+    ("_pick_and_place_raw", "PickAndPlace"),
+    ("_pump_reagent_raw", "PumpReagent"),
+    ("_home_w_raw", "HomeW"),
+    ("_home_xyz_raw", "HomeXYZ"),
+    ("_abort_raw", "Abort"),
+    ("_move_to_position_raw", "MoveToPosition"),
+    ("_set_head_mode_raw", "SetHeadMode"),
+    ("_set_liquid_class_raw", "SetLiquidClass"),
+    ("_set_tip_touch_raw", "SetTipTouch"),
+)
+
+# COM commands that raise a matching <Name>Complete event on the control
+_COMPLETION_EVENTS = frozenset(
+    {
+        "Aspirate",
+        "Dispense",
+        "Mix",
+        "Wash",
+        "TipsOn",
+        "TipsOff",
+        "MoveToLocation",
+        "MoveToPosition",
+        "PickAndPlace",
+        "PumpReagent",
+    }
+)
+
+
+class _CompletionWaiter:
+    """Wait for a non-blocking command's Complete or Error event
+
+    Used when the control runs with Blocking = False. The STA worker starts
+    the command, then pumps messages until the device reports back, so
+    events and other COM traffic keep flowing during long motions. Urgent
+    jobs such as abort run between pumps. Only touched from the STA worker
+    thread.
+    """
+
+    # Upper bound on each wait between message pumps, in milliseconds
+    POLL_MS = 50
+
+    __slots__ = ("_client", "_worker", "_pending", "_done", "_failed", "_aborted")
+
+    def __init__(self, client: Any, worker: _StaWorker) -> None:
+        self._client = client
+        self._worker = worker
+        # COM method of the command being waited for, None between commands
+        self._pending: Optional[str] = None
+        self._done = False
+        self._failed = False
+        self._aborted = False
+        for com_method in _COMPLETION_EVENTS:
+            event = getattr(client, f"{com_method}Complete")
+            event += self._complete_handler(com_method)
+        error = client.Error
+        error += self._on_error
+
+    def _complete_handler(self, com_method: str) -> Callable[[Any, Any], None]:
+        def on_complete(sender: Any, args: Any) -> None:
+            if com_method == self._pending:
+                self._done = True
+            else:
+                logger.debug(
+                    "Ignoring %sComplete while waiting for %s",
+                    com_method,
+                    self._pending,
+                )
+
+        return on_complete
+
+    def _on_error(self, sender: Any, args: Any) -> None:
+        # Errors between commands belong to no waiting call
+        if self._pending is not None:
+            self._failed = True
+            self._done = True
+
+    def abort(self, method: Callable[[], T]) -> T:
+        """Send Abort and stop waiting for the command in flight, if any"""
+        result = method()
+        self._aborted = self._done = True
+        return result
+
+    def run(
+        self,
+        driver: "BravoDriver",
+        com_method: str,
+        method: Callable[..., T],
+        *args,
+    ) -> T:
+        """Start a command and return once the device reports it finished
+
+        If no Complete or Error event for this command arrives within the
+        driver's timeout, the command is aborted and BravoTimeoutError raised.
+        """
+        self._done = self._failed = self._aborted = False
+        self._pending = com_method
+        try:
+            result = method(*args)
+            timeout = driver.timeout
+            deadline = None if timeout is None else time.monotonic() + timeout
+            worker = self._worker
+            while not self._done:
+                if deadline is not None and time.monotonic() >= deadline:
+                    # Stop the device before giving up on the command, so the
+                    # next queued command isn't sent while it still runs
+                    try:
+                        self._client.Abort()
+                    except Exception as e:
+                        logger.error("Failed to abort timed-out %s: %s", com_method, e)
+                    raise BravoTimeoutError(
+                        f"{com_method} did not complete within {timeout} s; aborted"
+                    )
+                worker.pump(self.POLL_MS)
+                worker.run_urgent()
+        finally:
+            self._pending = None
+        if self._aborted:
+            raise BravoCommandError(f"{com_method} aborted")
+        if self._failed:
+            raise BravoCommandError(
+                f"{com_method} failed: {self._client.GetLastError()}"
+            )
+        return result
+
+
+def _never_flush(name: str, args: tuple, kwargs: dict) -> bool:
+    return False
+
+
 class BravoDriver:
+    # Fixed attribute set; subclasses that need ad-hoc attributes (such as
+    # BravoDriverWithVisualization) get a __dict__ by not declaring slots
+    __slots__ = (
+        "profile",
+        "simulation_mode",
+        "blocking",
+        "timeout",
+        "enable_state_tracking",
+        "_ready",
+        "client",
+        "_com",
+        "_worker",
+        "deck_state",
+        "_simulation_state",
+        "_aspirate_impl",
+        "_dispense_impl",
+        "_outstanding",
+        "__weakref__",
+    ) + tuple(attr for attr, _ in _RAW_COM_METHODS)
+
+    # One STA worker and one Bravo control per process, shared by every
+    # driver so reconnects skip CLR/COM activation
+    _shared_worker: ClassVar[Optional[_StaWorker]] = None
+    _shared_client: ClassVar[Any] = None
+    _shared_ocx: ClassVar[Any] = None
+    _shared_waiter: ClassVar[Optional[_CompletionWaiter]] = None
+    # Connected hardware drivers; the control is closed when the last one
+    # disconnects
+    _shared_drivers: ClassVar["weakref.WeakSet[BravoDriver]"] = weakref.WeakSet()
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         profile: Optional[str] = None,
         simulation_mode: bool = False,
         enable_state_tracking: bool = True,
+        blocking: bool = True,
+        timeout: Optional[float] = 30.0,
     ) -> None:
         self.profile = profile
         self.simulation_mode = simulation_mode
+        # With blocking=False the control returns as soon as a command starts
+        # and the STA worker pumps messages until its Complete event, for at
+        # most ``timeout`` seconds (None waits indefinitely). Only this mode
+        # lets abort() interrupt a running command
+        self.blocking = blocking
+        self.timeout = timeout
         self.enable_state_tracking = enable_state_tracking
-        self._connected = False
+        self._ready = False
         self.client = None
+        # Object COM calls are made on: the direct OCX interface, or client
+        self._com: Any = None
+        self._worker: Optional[_StaWorker] = None
+        self._outstanding: Set[Future] = set()
 
         # Initialize state machine
         if self.enable_state_tracking:
             self.deck_state = BravoDeckState()
-            logging.info("State tracking enabled")
+            logger.info("State tracking enabled")
         else:
             self.deck_state = None
 
         # Simulation state tracking (legacy)
         if self.simulation_mode:
-            logging.info("BravoDriver initialized in SIMULATION mode")
-            self._simulation_state = {
-                "current_position": {"x": 0, "y": 0, "z": 0},
-                "tips_loaded": False,
-                "liquid_volume": 0.0,
-                "last_operation": None,
-            }
+            logger.info("BravoDriver initialized in SIMULATION mode")
+            self._simulation_state: Optional[_SimState] = _SimState()
         else:
             self._simulation_state = None
 
+        # aspirate/dispense dispatch targets. Simulation never needs a
+        # connection, like the other simulated commands; on hardware,
+        # connect() swaps in the STA path, so connected calls need no checks
+        if self.simulation_mode:
+            self._aspirate_impl = self._aspirate_sim
+            self._dispense_impl = self._dispense_sim
+        else:
+            self._aspirate_impl = self._dispense_impl = self._not_connected
+        # Bound COM methods, captured when the control is created
+        for attr, _ in _RAW_COM_METHODS:
+            setattr(self, attr, None)
+
         if not self.simulation_mode:
             if is_admin():
-                logging.warning(
+                logger.warning(
                     "Running without admin privileges may limit driver's functionality."
                 )
-            self._create_control()
 
     def _extract_operation_details(
         self, method_name: str, args: tuple, kwargs: dict
@@ -266,39 +887,86 @@ class BravoDriver:
         elif method_name == "tips_off":
             self.deck_state.update_tips_at_nest(nest_id, tips_on=False)
 
+    @sta_com_method
     def _create_control(self) -> None:
         """Create the control for the Bravo device"""
         if self.simulation_mode:
-            logging.info("SIMULATION: Bravo control creation simulated")
-            self._connected = True
+            logger.info("SIMULATION: Bravo control creation simulated")
+            self._ready = True
             return
 
-        if not self.client:
-            self.client = AxHomewood()
-            self.client.CreateControl()
-            self.client.Blocking = True
-            logging.info("Bravo control created successfully")
-        else:
-            logging.warning("Bravo control already exists")
-
-    def _handle_simulation(self, method_name: str, *args, **kwargs) -> Any:
-        """Handle simulation logic for various methods"""
-        if method_name in [
-            "get_activex_version",
-            "get_firmware_version",
-            "get_hardware_version",
-        ]:
-            return f"SIMULATION_VERSION_1.0.0"
-        elif method_name == "enumerate_profiles":
-            return ["Default", "Profile1", "Profile2"]
-        elif method_name == "get_last_error":
-            return "No errors in simulation"
-        elif method_name == "get_device_configuration":
-            return {"simulation": True, "config": "mock_config"}
-        elif method_name == "get_labware_at_location":
-            return 1  # Mock labware type
-        else:
-            return None
+        if self.client is not None and self.client is BravoDriver._shared_client:
+            logger.warning("Bravo control already exists")
+            return
+
+        if BravoDriver._shared_client is None:
+            client = AxHomewood()
+            client.CreateControl()
+            client.Blocking = self.blocking
+            BravoDriver._shared_client = client
+            BravoDriver._shared_ocx = _ocx_interface(client)
+            BravoDriver._shared_waiter = (
+                None if self.blocking else _CompletionWaiter(client, self._worker)
+            )
+            logger.info("Bravo control created successfully")
+        elif (BravoDriver._shared_waiter is None) != self.blocking:
+            # The mode belongs to the shared control, fixed by the first connect
+            logger.warning(
+                "Bravo control already open with blocking=%s; ignoring blocking=%s",
+                not self.blocking,
+                self.blocking,
+            )
+
+        self.client = BravoDriver._shared_client
+        # Bind the hot-path COM methods once instead of on every call,
+        # preferring the direct OCX interface when it could be resolved
+        target = self._com = BravoDriver._shared_ocx or self.client
+        waiter = BravoDriver._shared_waiter
+        for attr, com_method in _RAW_COM_METHODS:
+            method = getattr(target, com_method)
+            if waiter is not None:
+                if com_method in _COMPLETION_EVENTS:
+                    method = partial(waiter.run, self, com_method, method)
+                elif com_method == "Abort":
+                    method = partial(waiter.abort, method)
+            setattr(self, attr, method)
+
+    @classmethod
+    def release_shared_control(cls) -> None:
+        """Close the pooled Bravo control and stop its STA thread
+
+        Happens on its own when the last connected driver disconnects, and
+        at interpreter exit. Call it earlier to hand the device to another
+        process; drivers still attached to the old control are marked
+        disconnected and must connect() again, which opens a fresh one.
+        """
+        with cls._shared_lock:
+            for driver in list(cls._shared_drivers):
+                driver._detach()
+            worker, client = cls._take_shared_control()
+        cls._close_shared_control(worker, client)
+
+    @classmethod
+    def _take_shared_control(cls) -> Tuple[Optional[_StaWorker], Any]:
+        """Unpublish the shared worker and control; call with _shared_lock held"""
+        worker, client = cls._shared_worker, cls._shared_client
+        cls._shared_worker = cls._shared_client = cls._shared_ocx = None
+        cls._shared_waiter = None
+        cls._shared_drivers.clear()
+        return worker, client
+
+    @classmethod
+    def _close_shared_control(cls, worker: Optional[_StaWorker], client: Any) -> None:
+        """Close a control taken by _take_shared_control and stop its worker"""
+        if worker is None:
+            return
+        atexit.unregister(cls.release_shared_control)
+        if client is not None:
+            try:
+                worker.call(client.Close)
+            except Exception as e:
+                logger.error("Error closing Bravo device: %s", e)
+        worker.stop(timeout=5.0)
 
     # State management methods
     def get_deck_state(self) -> Optional[BravoDeckState]:
@@ -327,7 +995,7 @@ class BravoDriver:
                 nest_id, labware_type, labware_name
             )
             if success:
-                logging.info(f"Set labware '{labware_type}' at nest {nest_id}")
+                logger.info("Set labware '%s' at nest %s", labware_type, nest_id)
             return success
         return False
 
@@ -347,37 +1015,258 @@ class BravoDriver:
         """Reset all deck state tracking"""
         if self.deck_state:
             self.deck_state.reset_all_nests()
-            logging.info("Deck state reset")
+            logger.info("Deck state reset")
+
+    def batch(
+        self,
+        max_size: int = 16,
+        wait: Optional[float] = None,
+        should_execute: Optional[Callable[[str, tuple, dict], bool]] = None,
+    ) -> CommandBatch:
+        """Group commands so they run back-to-back in one STA scope
+
+        Usage:
+            with driver.batch() as b:
+                b.aspirate(100, 2)
+                b.dispense(100, plate_location=3)
+        """
+        return CommandBatch(self, max_size, wait, should_execute)
+
+    def script(self) -> CommandBatch:
+        """Record commands and run them all in one STA hand-off on exit
+
+        Unlike batch(), nothing is flushed early: the whole sequence (e.g. a
+        wash or remove protocol) is sent to the worker as a single job.
+
+        Usage:
+            with driver.script() as s:
+                s.tips_on(1)
+                s.aspirate(100, 2)
+                s.dispense(100, plate_location=3)
+                s.tips_off(1)
+            results = s.results
+        """
+        return CommandBatch(self, sys.maxsize, should_execute=_never_flush)
+
+    def run_batch(self, ops: List[Tuple[str, tuple, dict]]) -> List[Any]:
+        """Run (method name, args, kwargs) commands back-to-back on the STA worker
+
+        The whole list costs one hand-off to the worker thread; commands run
+        in order and the first failure stops the batch.
+        """
+        methods = [(getattr(self, name), a, kw) for name, a, kw in ops]
+
+        def run_all() -> List[Any]:
+            return [method(*a, **kw) for method, a, kw in methods]
+
+        return self._run_on_sta(run_all)
+
+    def _run_on_sta(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a callable on the STA worker, or inline when there is none"""
+        if self._worker is None:
+            return fn(*args, **kwargs)
+        return self._worker.call(fn, *args, **kwargs)
+
+    def submit_async(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """Queue a callable on the STA worker without waiting for it
+
+        The returned Future resolves with the callable's result. Use this for
+        fire-and-forget work that must run in the control's apartment.
+        """
+        if self._worker is None:
+            future: "Future[T]" = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._worker.submit(fn, *args, **kwargs)
+
+    def _submit_command(self, method: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """Queue a driver command on the STA worker and track it for wait_all"""
+        future = self.submit_async(method, *args, **kwargs)
+        if not future.done():
+            self._outstanding.add(future)
+            future.add_done_callback(self._outstanding.discard)
+        return future
+
+    def aspirate_async(
+        self,
+        volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float = 0.0,
+        pre_aspirate_volume: float = 0.0,
+        post_aspirate_volume: float = 0.0,
+        retract_distance_per_microliter: float = 0.0,
+    ) -> "Future[None]":
+        """Queue an aspirate and return immediately
+
+        State tracking and the COM call run on the STA worker; the Future
+        raises BravoCommandError if the aspirate fails.
+        """
+        return self._submit_command(
+            self.aspirate,
+            volume,
+            plate_location,
+            distance_from_well_bottom,
+            pre_aspirate_volume,
+            post_aspirate_volume,
+            retract_distance_per_microliter,
+        )
+
+    def dispense_async(
+        self,
+        volume: float,
+        empty_tips: bool = False,
+        blow_out_volume: float = 0.0,
+        plate_location: int = 0,
+        distance_from_well_bottom: float = 0.0,
+        retract_distance_per_microliter: float = 0.0,
+    ) -> "Future[None]":
+        """Queue a dispense and return immediately"""
+        return self._submit_command(
+            self.dispense,
+            volume,
+            empty_tips,
+            blow_out_volume,
+            plate_location,
+            distance_from_well_bottom,
+            retract_distance_per_microliter,
+        )
+
+    def prepare_aspirate(
+        self,
+        volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float = 0.0,
+        pre_aspirate_volume: float = 0.0,
+        post_aspirate_volume: float = 0.0,
+        retract_distance_per_microliter: float = 0.0,
+    ) -> Callable[[], None]:
+        """Return a no-argument callable that repeats this aspirate
+
+        The full positional argument tuple is built once, so repeated calls
+        skip default and keyword handling.
+
+        Usage:
+            aspirate_column = driver.prepare_aspirate(10, 2)
+            for _ in range(12):
+                aspirate_column()
+        """
+        return partial(
+            self.aspirate,
+            float(volume),
+            plate_location,
+            float(distance_from_well_bottom),
+            float(pre_aspirate_volume),
+            float(post_aspirate_volume),
+            float(retract_distance_per_microliter),
+        )
+
+    def prepare_dispense(
+        self,
+        volume: float,
+        empty_tips: bool = False,
+        blow_out_volume: float = 0.0,
+        plate_location: int = 0,
+        distance_from_well_bottom: float = 0.0,
+        retract_distance_per_microliter: float = 0.0,
+    ) -> Callable[[], None]:
+        """Return a no-argument callable that repeats this dispense"""
+        # plate_location stays a keyword so state tracking can find the nest
+        return partial(
+            self.dispense,
+            float(volume),
+            empty_tips,
+            float(blow_out_volume),
+            plate_location=plate_location,
+            distance_from_well_bottom=float(distance_from_well_bottom),
+            retract_distance_per_microliter=float(retract_distance_per_microliter),
+        )
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued async commands; True if all of them finished"""
+        if not self._outstanding:
+            return True
+        _, not_done = wait(list(self._outstanding), timeout)
+        return not not_done
+
+    async def run_async(self, method: str, *args, **kwargs) -> Any:
+        """Await a driver command without blocking the event loop
+
+        The command runs on the STA worker, so other coroutines keep running
+        during long COM calls such as homing or a mix cycle.
+
+        Usage:
+            await driver.run_async("mix", 50, 0, 0, 3, plate_location=4, ...)
+        """
+        import asyncio
+
+        return await asyncio.wrap_future(
+            self._submit_command(getattr(self, method), *args, **kwargs)
+        )
 
     # Core connection methods
     def is_connected(self) -> bool:
-        return self._connected and (self.client is not None or self.simulation_mode)
+        return self._ready
 
     def connect(self) -> None:
         """Connect to the Bravo device"""
         if self.simulation_mode:
-            logging.info("SIMULATION: Connection established")
-            self._connected = True
+            logger.info("SIMULATION: Connection established")
+            self._ready = True
             return
 
-        # For real hardware, create control if not already done
-        if not self.client:
-            self._create_control()
-        self._connected = True
+        # For real hardware, load the SDK and create the shared control on
+        # first use; later connects reuse it
+        with BravoDriver._shared_lock:
+            if BravoDriver._shared_worker is None:
+                _load_sdk()
+                BravoDriver._shared_worker = _StaWorker()
+                atexit.register(BravoDriver.release_shared_control)
+            self._worker = BravoDriver._shared_worker
+            # Attach (again) unless this driver already uses the live control
+            if self.client is None or self.client is not BravoDriver._shared_client:
+                self._create_control()
+            # Hand the hot paths straight to the worker; partial() adds no
+            # Python frame of its own
+            self._aspirate_impl = partial(self._worker.call, self._aspirate_hw)
+            self._dispense_impl = partial(self._worker.call, self._dispense_hw)
+            self._ready = True
+            BravoDriver._shared_drivers.add(self)
 
     def disconnect(self) -> None:
-        """Disconnect from the Bravo device"""
+        """Disconnect from the Bravo device
+
+        The shared control stays open while other drivers are connected to
+        it; the last driver to disconnect closes it.
+        """
         if self.simulation_mode:
-            logging.info("SIMULATION: Connection closed")
-            self._connected = False
+            logger.info("SIMULATION: Connection closed")
+            self._ready = False
             return
-
-        self._close()
+        # Same lock as connect() so a racing connect/disconnect pair can't
+        # leave the driver half attached, or close a control just reused
+        with BravoDriver._shared_lock:
+            attached = self in BravoDriver._shared_drivers
+            self._detach()
+            if attached and not BravoDriver._shared_drivers:
+                worker, client = BravoDriver._take_shared_control()
+            else:
+                worker = client = None
+        BravoDriver._close_shared_control(worker, client)
+
+    def _detach(self) -> None:
+        """Mark the driver disconnected; call with _shared_lock held"""
+        self._ready = False
+        self._aspirate_impl = self._dispense_impl = self._not_connected
+        BravoDriver._shared_drivers.discard(self)
+
+    def _not_connected(self, *args) -> None:
+        raise BravoCommandError("Device not connected")
 
     # Enhanced operation methods with state tracking
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
     def aspirate(
         self,
         volume: float,
@@ -388,30 +1277,87 @@ class BravoDriver:
         retract_distance_per_microliter: float = 0.0,
     ) -> None:
         """Aspirate a specified volume from a well"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
+        if volume <= 0:
+            raise BravoCommandError("Volume must be positive")
+        # Dispatches to _aspirate_sim, or to _aspirate_hw on the STA worker
         try:
-            logging.info(f"Aspirating {volume} uL from plate location {plate_location}")
-            if self.simulation_mode:
-                self._simulation_state["liquid_volume"] = volume
-                self._simulation_state["last_operation"] = "aspirate"
-                return
-
-            self.client.Aspirate(
+            return self._aspirate_impl(
                 volume,
-                pre_aspirate_volume,
-                post_aspirate_volume,
                 plate_location,
                 distance_from_well_bottom,
+                pre_aspirate_volume,
+                post_aspirate_volume,
                 retract_distance_per_microliter,
             )
+        except BravoConnectionError as e:
+            # The shared worker was stopped under a still-connected driver
+            raise BravoCommandError(f"Failed to aspirate: {e}") from e
+
+    def _aspirate_sim(
+        self,
+        volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float,
+        pre_aspirate_volume: float,
+        post_aspirate_volume: float,
+        retract_distance_per_microliter: float,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Aspirating %s uL from plate location %s", volume, plate_location
+            )
+        sim = self._simulation_state
+        sim.commands.append(
+            (
+                "aspirate",
+                (
+                    volume,
+                    plate_location,
+                    distance_from_well_bottom,
+                    pre_aspirate_volume,
+                    post_aspirate_volume,
+                    retract_distance_per_microliter,
+                ),
+                {},
+            )
+        )
+        sim.liquid_volume = volume
+        sim.last_operation = "aspirate"
+
+    def _aspirate_hw(
+        self,
+        volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float,
+        pre_aspirate_volume: float,
+        post_aspirate_volume: float,
+        retract_distance_per_microliter: float,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Aspirating %s uL from plate location %s", volume, plate_location
+            )
+        self._safe_call(
+            "aspirate",
+            self._aspirate_raw,
+            volume,
+            pre_aspirate_volume,
+            post_aspirate_volume,
+            plate_location,
+            distance_from_well_bottom,
+            retract_distance_per_microliter,
+        )
+
+    def _safe_call(self, what: str, fn: Callable[..., T], *args) -> T:
+        """Call into the control, reporting failures as BravoCommandError"""
+        try:
+            return fn(*args)
+        except BravoCommandError:
+            raise
         except Exception as e:
-            raise BravoCommandError(f"Failed to aspirate: {e}")
+            raise BravoCommandError(f"Failed to {what}: {e}") from e
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
     def dispense(
         self,
         volume: float,
@@ -422,18 +1368,12 @@ class BravoDriver:
         retract_distance_per_microliter: float = 0.0,
     ) -> None:
         """Dispense a specified volume into a well"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        # Zero is allowed: emptying tips or a blow-out dispenses no set volume
+        if volume < 0:
+            raise BravoCommandError("Volume must be positive")
+        # Dispatches to _dispense_sim, or to _dispense_hw on the STA worker
         try:
-            logging.info(f"Dispensing {volume} uL into plate location {plate_location}")
-            if self.simulation_mode:
-                self._simulation_state["liquid_volume"] = max(
-                    0, self._simulation_state["liquid_volume"] - volume
-                )
-                self._simulation_state["last_operation"] = "dispense"
-                return
-
-            self.client.Dispense(
+            return self._dispense_impl(
                 volume,
                 empty_tips,
                 blow_out_volume,
@@ -441,12 +1381,67 @@ class BravoDriver:
                 distance_from_well_bottom,
                 retract_distance_per_microliter,
             )
-        except Exception as e:
-            raise BravoCommandError(f"Failed to dispense: {e}")
+        except BravoConnectionError as e:
+            # The shared worker was stopped under a still-connected driver
+            raise BravoCommandError(f"Failed to dispense: {e}") from e
+
+    def _dispense_sim(
+        self,
+        volume: float,
+        empty_tips: bool,
+        blow_out_volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float,
+        retract_distance_per_microliter: float,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Dispensing %s uL into plate location %s", volume, plate_location
+            )
+        sim = self._simulation_state
+        sim.commands.append(
+            (
+                "dispense",
+                (
+                    volume,
+                    empty_tips,
+                    blow_out_volume,
+                    plate_location,
+                    distance_from_well_bottom,
+                    retract_distance_per_microliter,
+                ),
+                {},
+            )
+        )
+        sim.liquid_volume = max(0, sim.liquid_volume - volume)
+        sim.last_operation = "dispense"
+
+    def _dispense_hw(
+        self,
+        volume: float,
+        empty_tips: bool,
+        blow_out_volume: float,
+        plate_location: int,
+        distance_from_well_bottom: float,
+        retract_distance_per_microliter: float,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Dispensing %s uL into plate location %s", volume, plate_location
+            )
+        self._safe_call(
+            "dispense",
+            self._dispense_raw,
+            volume,
+            empty_tips,
+            blow_out_volume,
+            plate_location,
+            distance_from_well_bottom,
+            retract_distance_per_microliter,
+        )
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def mix(
         self,
         volume: float,
@@ -458,32 +1453,25 @@ class BravoDriver:
         retract_distance_per_microliter: float,
     ) -> None:
         """Mix a specified volume in a well"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(
-                f"Mixing {volume} uL in plate location {plate_location} for {cycles} cycles"
-            )
-            if self.simulation_mode:
-                self._simulation_state["last_operation"] = "mix"
-                return
-
-            self.client.Mix(
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Mixing %s uL in plate location %s for %s cycles",
                 volume,
-                pre_aspirate_volume,
-                blow_out_volume,
-                cycles,
                 plate_location,
-                distance_from_well_bottom,
-                retract_distance_per_microliter,
+                cycles,
             )
-        except Exception as e:
-            raise BravoCommandError(f"Failed to mix: {e}")
+        self._mix_raw(
+            volume,
+            pre_aspirate_volume,
+            blow_out_volume,
+            cycles,
+            plate_location,
+            distance_from_well_bottom,
+            retract_distance_per_microliter,
+        )
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def wash(
         self,
         volume: float,
@@ -498,91 +1486,63 @@ class BravoDriver:
         pump_out_flow_speed: float = 0.0,
     ) -> None:
         """Wash Tips"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-        try:
-            logging.info(
-                f"Washing {volume} uL in plate location {plate_location} for {cycles} cycles"
-            )
-            if self.simulation_mode:
-                self._simulation_state["last_operation"] = "wash"
-                return
-
-            self.client.Wash(
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Washing %s uL in plate location %s for %s cycles",
                 volume,
-                empty_tips,
-                pre_aspirate_volume,
-                blow_out_volume,
-                cycles,
                 plate_location,
-                distance_from_well_bottom,
-                retract_distance_per_microliter,
-                pump_in_flow_speed,
-                pump_out_flow_speed,
+                cycles,
             )
-        except Exception as e:
-            raise BravoCommandError(f"Failed to wash: {e}")
+        self._wash_raw(
+            volume,
+            empty_tips,
+            pre_aspirate_volume,
+            blow_out_volume,
+            cycles,
+            plate_location,
+            distance_from_well_bottom,
+            retract_distance_per_microliter,
+            pump_in_flow_speed,
+            pump_out_flow_speed,
+        )
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def tips_on(self, plate_location: int, tip_type: str = "standard") -> None:
         """Turn on tips at a specific plate location"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(f"Turning on tips at plate location {plate_location}")
-            if self.simulation_mode:
-                self._simulation_state["tips_loaded"] = True
-                return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Turning on tips at plate location %s", plate_location)
+        self._tips_on_raw(plate_location)
 
-            self.client.TipsOn(plate_location)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to turn on tips: {e}")
+    def _tips_on_sim(self, plate_location: int, tip_type: str = "standard") -> None:
+        self._simulation_state.tips_loaded = True
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def tips_off(self, plate_location: int) -> None:
         """Turn off tips at a specific plate location"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Turning off tips at plate location %s", plate_location)
+        self._tips_off_raw(plate_location)
 
-        try:
-            logging.info(f"Turning off tips at plate location {plate_location}")
-            if self.simulation_mode:
-                self._simulation_state["tips_loaded"] = False
-                return
-
-            self.client.TipsOff(plate_location)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to turn off tips: {e}")
+    def _tips_off_sim(self, plate_location: int) -> None:
+        self._simulation_state.tips_loaded = False
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def move_to_location(self, plate_location: int, only_z: bool = False) -> None:
         """Move to a specific plate location"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(f"Moving to plate location {plate_location}, only_z={only_z}")
-            if self.simulation_mode:
-                self._simulation_state["current_position"] = {
-                    "location": plate_location
-                }
-                self._simulation_state["last_operation"] = "move"
-                return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Moving to plate location %s, only_z=%s", plate_location, only_z
+            )
+        self._move_to_location_raw(plate_location, only_z)
 
-            self.client.MoveToLocation(plate_location, only_z)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to move to location: {e}")
+    def _move_to_location_sim(self, plate_location: int, only_z: bool = False) -> None:
+        self._simulation_state.current_position = {"location": plate_location}
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def pick_and_place(
         self,
         start_location: int,
@@ -591,41 +1551,33 @@ class BravoDriver:
         labware_thickness: float,
     ) -> None:
         """Perform a pick and place operation"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(
-                f"Picking from location {start_location} and placing at {end_location} with gripper offset {gripper_offset}"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Picking from location %s and placing at %s with gripper offset %s",
+                start_location,
+                end_location,
+                gripper_offset,
             )
-            if self.simulation_mode:
-                self._simulation_state["last_operation"] = "pick_and_place"
-                return
+        self._pick_and_place_raw(start_location, end_location, gripper_offset)
 
-            self.client.PickAndPlace(start_location, end_location, gripper_offset)
-
-            # Update state tracking for labware movement
-            if self.deck_state:
-                # Get labware from start location
-                start_nest = self.deck_state.get_nest(start_location)
-                if start_nest and start_nest.labware_type != LabwareType.EMPTY:
-                    labware_type = start_nest.labware_type
-                    labware_name = start_nest.labware_name
-
-                    # Clear start location
-                    self.deck_state.set_labware_at_nest(start_location, "empty")
-
-                    # Set end location
-                    self.deck_state.set_labware_at_nest(
-                        end_location, labware_type.value, labware_name
-                    )
-
-        except Exception as e:
-            raise BravoCommandError(f"Failed to pick and place: {e}")
+        # Update state tracking for labware movement
+        if self.deck_state:
+            # Get labware from start location
+            start_nest = self.deck_state.get_nest(start_location)
+            if start_nest and start_nest.labware_type != LabwareType.EMPTY:
+                labware_type = start_nest.labware_type
+                labware_name = start_nest.labware_name
+
+                # Clear start location
+                self.deck_state.set_labware_at_nest(start_location, "empty")
+
+                # Set end location
+                self.deck_state.set_labware_at_nest(
+                    end_location, labware_type.value, labware_name
+                )
 
     @state_tracking_method
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def pump_reagent(
         self,
         plate_location: int,
@@ -633,371 +1585,234 @@ class BravoDriver:
         pump_speed: float,
         pump_time: float,
     ) -> None:
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-        try:
-            logging.info(
-                f"Pumping reagent at plate location {plate_location}, fill_reservoir={fill_reservoir}, pump_speed={pump_speed}, pump_time={pump_time}"
-            )
-            if self.simulation_mode:
-                self._simulation_state["last_operation"] = "pump_reagent"
-                return
-
-            self.client.PumpReagent(
-                plate_location, fill_reservoir, pump_speed, pump_time
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Pumping reagent at plate location %s, fill_reservoir=%s, pump_speed=%s, pump_time=%s",
+                plate_location,
+                fill_reservoir,
+                pump_speed,
+                pump_time,
             )
-        except Exception as e:
-            raise BravoCommandError(f"Failed to pump reagent: {e}")
+        self._pump_reagent_raw(plate_location, fill_reservoir, pump_speed, pump_time)
 
     # Non-state-tracking methods (these don't interact with specific nests)
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def home_w(self) -> None:
-        try:
-            if not self.is_connected():
-                raise BravoCommandError("Device not connected")
-            logging.info("Homing operation started")
-            self.client.HomeW()
-        except Exception as e:
-            raise BravoCommandError(f"Failed to home device: {e}")
+        logger.info("Homing operation started")
+        self._home_w_raw()
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def home_xyz(self) -> None:
-        try:
-            if not self.is_connected():
-                raise BravoCommandError("Device not connected")
-            logging.info("Homing XYZ operation started")
-            self.client.HomeXYZ()
-        except Exception as e:
-            raise BravoCommandError(f"Failed to home XYZ: {e}")
+        logger.info("Homing XYZ operation started")
+        self._home_xyz_raw()
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def show_about_box(self) -> None:
         """Show the About box"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            self.client.ShowAboutBox()
-        except Exception as e:
-            raise BravoCommandError(f"Failed to show About box: {e}")
+        self.client.ShowAboutBox()
 
-    @simulation_aware_method
+    @bravo_com
     def show_about(self) -> None:
         """Show the About dialog"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        self.client.ShowAboutDialog()
 
-        try:
-            self.client.ShowAboutDialog()
-        except Exception as e:
-            raise BravoCommandError(f"Failed to show About dialog: {e}")
-
-    @simulation_aware_method
     def abort(self) -> None:
-        """Abort the current operation"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info("Aborting current operation")
-            if self.simulation_mode:
-                self._simulation_state["last_operation"] = "abort"
-
-            # Mark all active operations as aborted
-            if self.deck_state:
-                active_ops = self.deck_state.get_active_operations()
-                for op in active_ops:
-                    self.deck_state.complete_operation_at_nest(op["nest_id"])
+        """Abort the current operation
+
+        Interrupting a running command only works with blocking=False: the
+        abort skips the STA worker's queue and is sent while the command
+        waits for its Complete event, and that command raises
+        BravoCommandError. With blocking=True the control holds the STA
+        thread inside the running call, so the abort cannot reach the
+        device until that command has finished; it then runs ahead of any
+        queued work.
+
+        Async commands still queued on the STA worker are cancelled first so
+        they don't start once the abort has run.
+        """
+        for future in list(self._outstanding):
+            future.cancel()
+        self._abort()
+
+    @bravo_com
+    def _abort(self) -> None:
+        logger.info("Aborting current operation")
+
+        # Mark all active operations as aborted
+        if self.deck_state:
+            active_ops = self.deck_state.get_active_operations()
+            for op in active_ops:
+                self.deck_state.complete_operation_at_nest(op["nest_id"])
 
-            if not self.simulation_mode:
-                self.client.Abort()
+        self._abort_raw()
 
-        except Exception as e:
-            raise BravoCommandError(f"Failed to abort operation: {e}")
+    def _query(self, com_method: str, label: str, *args) -> Any:
+        """Call a read-only COM method and log what it returned"""
+        value = getattr(self._com, com_method)(*args)
+        logger.info("%s: %s", label, value)
+        return value
 
-    @simulation_aware_method
+    @bravo_com
     def enumerate_profiles(self) -> List[str]:
         """Enumerate available profiles"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        profiles = _array_to_list(self.client.GetProfiles())
+        logger.info("Available profiles: %s", profiles)
+        return profiles
 
-        try:
-            profiles = self.client.GetProfiles()
-            logging.info(f"Available profiles: {profiles}")
-            return profiles
-        except Exception as e:
-            raise BravoCommandError(f"Failed to enumerate profiles: {e}")
-
-    @simulation_aware_method
+    @bravo_com
     def get_activex_version(self) -> str:
         """Get the ActiveX version of the Bravo SDK"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            version = self.client.GetActiveXVersion()
-            logging.info(f"ActiveX Version: {version}")
-            return version
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get ActiveX version: {e}")
+        return self._query("GetActiveXVersion", "ActiveX Version")
 
-    @simulation_aware_method
+    @bravo_com
     def get_device_configuration(self, configuration_file: str) -> Dict[str, Any]:
         """Get the current device configuration"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-        try:
-            config = self.client.GetDeviceConfiguration(configuration_file)
-            logging.info(f"Device Configuration: {config}")
-            return config
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get device configuration: {e}")
+        return self._query(
+            "GetDeviceConfiguration", "Device Configuration", configuration_file
+        )
 
-    @simulation_aware_method
+    @bravo_com
     def get_firmware_version(self) -> str:
         """Get the firmware version of the Bravo device"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            firmware_version = self.client.GetFirmwareVersion()
-            logging.info(f"Firmware Version: {firmware_version}")
-            return firmware_version
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get firmware version: {e}")
+        return self._query("GetFirmwareVersion", "Firmware Version")
 
-    @simulation_aware_method
+    @bravo_com
     def get_hardware_version(self) -> str:
         """Get the hardware version of the Bravo device"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        return self._query("GetHardwareVersion", "Hardware Version")
 
-        try:
-            hardware_version = self.client.GetHardwareVersion()
-            logging.info(f"Hardware Version: {hardware_version}")
-            return hardware_version
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get hardware version: {e}")
-
-    @simulation_aware_method
+    @bravo_com
     def get_labware_at_location(self, plate_location: int, labware_name: str) -> int:
         """Get the labware type at a specific plate location"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        labware = self._com.GetLabwareAtLocation(plate_location, labware_name)
+        logger.info("Labware at location %s: %s", plate_location, labware)
+        return labware
 
-        try:
-            labware = self.client.GetLabwareAtLocation(plate_location, labware_name)
-            logging.info(f"Labware at location {plate_location}: {labware}")
-            return labware
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get labware at location: {e}")
-
-    @simulation_aware_method
+    @bravo_com
     def get_last_error(self) -> str:
         """Get the last error message from the Bravo device"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            last_error = self.client.GetLastError()
-            logging.info(f"Last Error: {last_error}")
-            return last_error
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get last error: {e}")
+        return self._query("GetLastError", "Last Error")
 
-    @simulation_aware_method
+    @bravo_com
     def initialize(self, profile) -> None:
         """Initialize the Bravo device with a specific profile"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(f"Initializing Bravo device with profile: {profile}")
-            if self.simulation_mode:
-                self.profile = profile
-                return
+        logger.info("Initializing Bravo device with profile: %s", profile)
+        self._com.Initialize(profile)
 
-            self.client.Initialize(profile)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to initialize device: {e}")
+    def _initialize_sim(self, profile) -> None:
+        self.profile = profile
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def move_to_position(
         self, axis: int, position: float, velocity: float, acceleration: float
     ) -> None:
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-        try:
-            logging.info(
-                f"Moving axis {axis} to position {position} with velocity {velocity} and acceleration {acceleration}"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Moving axis %s to position %s with velocity %s and acceleration %s",
+                axis,
+                position,
+                velocity,
+                acceleration,
             )
-            if self.simulation_mode:
-                self._simulation_state["current_position"][f"axis_{axis}"] = position
-                return
-
-            self.client.MoveToPosition(axis, position, velocity, acceleration)
+        self._move_to_position_raw(axis, position, velocity, acceleration)
 
-        except Exception as e:
-            raise BravoCommandError(f"Failed to move to position: {e}")
+    def _move_to_position_sim(
+        self, axis: int, position: float, velocity: float, acceleration: float
+    ) -> None:
+        self._simulation_state.current_position[f"axis_{axis}"] = position
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def set_head_mode(self, mode: int) -> None:
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-        try:
-            logging.info(f"Setting head mode to {mode}")
-            if self.simulation_mode:
-                self._simulation_state["head_mode"] = mode
-                return
+        logger.info("Setting head mode to %s", mode)
+        self._set_head_mode_raw(mode)
 
-            self.client.SetHeadMode(mode)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to set head mode: {e}")
+    def _set_head_mode_sim(self, mode: int) -> None:
+        self._simulation_state.head_mode = mode
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def set_labware_at_location(self, plate_location: int, labware_type: str) -> None:
         """Set the labware type at a specific plate location"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        logger.info("Setting labware %s at location %s", labware_type, plate_location)
 
-        try:
-            logging.info(f"Setting labware {labware_type} at location {plate_location}")
-            if self.simulation_mode:
-                self._simulation_state[f"labware_{plate_location}"] = labware_type
-
-            # Update state tracking
-            if self.deck_state:
-                self.deck_state.set_labware_at_nest(plate_location, labware_type)
+        # Update state tracking
+        if self.deck_state:
+            self.deck_state.set_labware_at_nest(plate_location, labware_type)
 
-            if not self.simulation_mode:
-                self.client.SetLabwareAtLocation(plate_location, labware_type)
+        self._com.SetLabwareAtLocation(plate_location, labware_type)
 
-        except Exception as e:
-            raise BravoCommandError(f"Failed to set labware at location: {e}")
+    def _set_labware_at_location_sim(
+        self, plate_location: int, labware_type: str
+    ) -> None:
+        self._simulation_state.labware[plate_location] = labware_type
 
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def set_liquid_class(self, liquid_class: str) -> None:
         """Set the liquid class for operations"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
+        logger.info("Setting liquid class to %s", liquid_class)
+        self._set_liquid_class_raw(liquid_class)
 
-        try:
-            logging.info(f"Setting liquid class to {liquid_class}")
-            if self.simulation_mode:
-                self._simulation_state["liquid_class"] = liquid_class
-                return
+    def _set_liquid_class_sim(self, liquid_class: str) -> None:
+        self._simulation_state.liquid_class = liquid_class
 
-            self.client.SetLiquidClass(liquid_class)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to set liquid class: {e}")
-
-    @simulation_aware_method
-    @sta_com_method
+    @bravo_com
     def set_tip_touch(
         self, number_of_side: int, retract_distance: float, horizontal_offset: float
     ) -> None:
         """Set the tip touch parameters"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            logging.info(
-                f"Setting tip touch with number_of_side={number_of_side}, retract_distance={retract_distance}, horizontal_offset={horizontal_offset}"
-            )
-            if self.simulation_mode:
-                self._simulation_state["tip_touch"] = {
-                    "number_of_side": number_of_side,
-                    "retract_distance": retract_distance,
-                    "horizontal_offset": horizontal_offset,
-                }
-                return
-
-            self.client.SetTipTouch(number_of_side, retract_distance, horizontal_offset)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to set tip touch: {e}")
+        logger.info(
+            "Setting tip touch with number_of_side=%s, retract_distance=%s, horizontal_offset=%s",
+            number_of_side,
+            retract_distance,
+            horizontal_offset,
+        )
+        self._set_tip_touch_raw(number_of_side, retract_distance, horizontal_offset)
+
+    def _set_tip_touch_sim(
+        self, number_of_side: int, retract_distance: float, horizontal_offset: float
+    ) -> None:
+        self._simulation_state.tip_touch = {
+            "number_of_side": number_of_side,
+            "retract_distance": retract_distance,
+            "horizontal_offset": horizontal_offset,
+        }
 
-    @simulation_aware_method
+    @bravo_com
     def show_diagnostics(self) -> None:
         """Show diagnostics information"""
-        if not self.is_connected():
-            raise BravoCommandError("Device not connected")
-
-        try:
-            if self.simulation_mode:
-                logging.info("SIMULATION: Diagnostics dialog would be shown")
-                return
-
-            self.client.ShowDiagsDialog(True, 1)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to get diagnostics: {e}")
+        self._com.ShowDiagsDialog(True, 1)
 
-    @simulation_aware_method
+    @bravo_com
     def show_labware_editor(self) -> None:
         """Show the labware editor dialog"""
-        try:
-            if self.simulation_mode:
-                logging.info("SIMULATION: Labware editor dialog would be shown")
-                return
-
-            # Setting visibility mask to 1 always.
-            self.client.ShowLabwareEditor(1)
-        except Exception as e:
-            raise BravoCommandError(f"Failed to show labware editor: {e}")
+        # Setting visibility mask to 1 always.
+        self._com.ShowLabwareEditor(1)
 
-    @simulation_aware_method
+    @bravo_com
     def show_liquid_library_editor(self) -> None:
         """Show the liquid library editor dialog"""
-        try:
-            if self.simulation_mode:
-                logging.info("SIMULATION: Liquid library editor dialog would be shown")
-                return
-
-            self.client.ShowLiquidLibraryEditor()
-        except Exception as e:
-            raise BravoCommandError(f"Failed to show liquid library editor: {e}")
+        self._com.ShowLiquidLibraryEditor()
 
     # Legacy simulation methods for backward compatibility
-    def get_simulation_state(self) -> Optional[Dict[str, Any]]:
+    def get_simulation_state(self) -> Optional[SimStateSnapshot]:
         """Get the current simulation state (only available in simulation mode)"""
         if not self.simulation_mode:
             return None
-        return self._simulation_state.copy()
+        return self._simulation_state.snapshot()
 
-    def __del__(self):
-        """Destructor to ensure proper cleanup"""
-        if self.is_connected():
-            try:
-                logging.info("Cleaning up BravoDriver resources")
-                if not self.simulation_mode:
-                    self._close()
-                else:
-                    self._connected = False
-            except Exception as e:
-                logging.error(f"Error during cleanup: {e}")
+    def get_simulation_commands(self) -> List[Tuple[str, tuple, dict]]:
+        """Commands issued so far in simulation mode, as (name, args, kwargs)
 
-    def _close(self) -> None:
-        """Close the Bravo device connection"""
-        if self.simulation_mode:
-            logging.info("SIMULATION: Bravo device connection closed")
-            self._connected = False
-            return
+        Lets a protocol be dry-run and checked without a device; empty when
+        not simulating. Only the last SIM_COMMAND_HISTORY commands are kept.
+        """
+        if not self.simulation_mode:
+            return []
+        return list(self._simulation_state.commands)
 
-        if self.client:
-            try:
-                logging.info("Closing Bravo device connection")
-                self.client.Close()
-                self._connected = False
-            except Exception as e:
-                raise BravoCommandError(f"Failed to close device: {e}")
-        else:
-            logging.warning("Bravo device client is not initialized")
+    def clear_simulation_commands(self) -> None:
+        """Forget the simulated commands recorded so far"""
+        if self.simulation_mode:
+            self._simulation_state.commands.clear()
 
     def __enter__(self):
         """Context manager support"""
@@ -1007,5 +1822,100 @@ class BravoDriver:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager cleanup"""
+        # Let queued async commands finish before closing the device
+        self.wait_all()
         if self.is_connected():
             self.disconnect()
+
+
+class BravoDriverPool:
+    """Fixed set of pre-connected drivers checked out one caller at a time
+
+    Meant for servers that handle requests on many threads: connecting is
+    paid once up front, and a request holding a driver has it to itself
+    until it is released. All hardware drivers share the one Bravo control,
+    so the default size of 1 also serializes protocols on the device.
+
+    Usage:
+        pool = BravoDriverPool(profile="Default")
+        with pool.driver() as bravo:
+            bravo.aspirate(10, 2)
+    """
+
+    __slots__ = ("_idle", "_drivers", "_checked_out", "_lock", "_closed")
+
+    def __init__(self, size: int = 1, **driver_kwargs) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._idle: "queue.SimpleQueue[BravoDriver]" = queue.SimpleQueue()
+        self._drivers: List[BravoDriver] = []
+        # Drivers currently held by callers, guarded by _lock
+        self._checked_out: Set[BravoDriver] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            driver = BravoDriver(**driver_kwargs)
+            driver.connect()
+            self._drivers.append(driver)
+            self._idle.put(driver)
+
+    def acquire(self, timeout: Optional[float] = None) -> BravoDriver:
+        """Check out a driver, waiting up to ``timeout`` seconds for one"""
+        if self._closed:
+            raise BravoConnectionError("Bravo driver pool is closed")
+        try:
+            driver = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise BravoConnectionError("No Bravo driver available") from None
+        with self._lock:
+            self._checked_out.add(driver)
+        return driver
+
+    def release(self, driver: BravoDriver) -> None:
+        """Return a driver once its queued commands have finished"""
+        with self._lock:
+            if driver not in self._checked_out:
+                raise ValueError("Driver is not checked out from this pool")
+        driver.wait_all()
+        with self._lock:
+            self._checked_out.discard(driver)
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None) -> Iterator[BravoDriver]:
+        """Check out a driver for the duration of a ``with`` block"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Disconnect every driver once all of them have been released
+
+        Waits up to ``timeout`` seconds for checked-out drivers to come back;
+        if any are still out, nothing is disconnected and
+        BravoConnectionError is raised.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        returned = []
+        try:
+            for _ in self._drivers:
+                remaining = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                returned.append(self._idle.get(timeout=remaining))
+        except queue.Empty:
+            # Leave the pool usable so the caller can release and retry
+            for driver in returned:
+                self._idle.put(driver)
+            self._closed = False
+            raise BravoConnectionError(
+                f"{len(self._drivers) - len(returned)} Bravo driver(s) still checked out"
+            ) from None
+        for driver in returned:
+            driver.wait_all()
+            driver.disconnect()
@@ -0,0 +1,110 @@
+// Minimal MessagePack decoder for the visualizer's binary frames.
+// Served next to index.html so the page has no third-party dependency;
+// exposes MessagePack.decode(Uint8Array) like @msgpack/msgpack.
+(function (global) {
+    'use strict';
+
+    const textDecoder = new TextDecoder('utf-8');
+
+    function decode(bytes) {
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        let pos = 0;
+
+        function str(length) {
+            const value = textDecoder.decode(bytes.subarray(pos, pos + length));
+            pos += length;
+            return value;
+        }
+
+        function bin(length) {
+            const value = bytes.slice(pos, pos + length);
+            pos += length;
+            return value;
+        }
+
+        function array(length) {
+            const value = new Array(length);
+            for (let i = 0; i < length; i++) {
+                value[i] = read();
+            }
+            return value;
+        }
+
+        function map(length) {
+            const value = {};
+            for (let i = 0; i < length; i++) {
+                const key = read();
+                value[key] = read();
+            }
+            return value;
+        }
+
+        function ext(length) {
+            const type = view.getInt8(pos);
+            pos += 1;
+            return { type: type, data: bin(length) };
+        }
+
+        function uint64() {
+            const value = view.getUint32(pos) * 4294967296 + view.getUint32(pos + 4);
+            pos += 8;
+            return value;
+        }
+
+        function int64() {
+            const value = view.getInt32(pos) * 4294967296 + view.getUint32(pos + 4);
+            pos += 8;
+            return value;
+        }
+
+        function read() {
+            const byte = bytes[pos++];
+            let value;
+
+            if (byte <= 0x7f) return byte;
+            if (byte >= 0xe0) return byte - 0x100;
+            if (byte <= 0x8f) return map(byte & 0x0f);
+            if (byte <= 0x9f) return array(byte & 0x0f);
+            if (byte <= 0xbf) return str(byte & 0x1f);
+
+            switch (byte) {
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xc4: value = bytes[pos]; pos += 1; return bin(value);
+                case 0xc5: value = view.getUint16(pos); pos += 2; return bin(value);
+                case 0xc6: value = view.getUint32(pos); pos += 4; return bin(value);
+                case 0xc7: value = bytes[pos]; pos += 1; return ext(value);
+                case 0xc8: value = view.getUint16(pos); pos += 2; return ext(value);
+                case 0xc9: value = view.getUint32(pos); pos += 4; return ext(value);
+                case 0xca: value = view.getFloat32(pos); pos += 4; return value;
+                case 0xcb: value = view.getFloat64(pos); pos += 8; return value;
+                case 0xcc: value = bytes[pos]; pos += 1; return value;
+                case 0xcd: value = view.getUint16(pos); pos += 2; return value;
+                case 0xce: value = view.getUint32(pos); pos += 4; return value;
+                case 0xcf: return uint64();
+                case 0xd0: value = view.getInt8(pos); pos += 1; return value;
+                case 0xd1: value = view.getInt16(pos); pos += 2; return value;
+                case 0xd2: value = view.getInt32(pos); pos += 4; return value;
+                case 0xd3: return int64();
+                case 0xd4: return ext(1);
+                case 0xd5: return ext(2);
+                case 0xd6: return ext(4);
+                case 0xd7: return ext(8);
+                case 0xd8: return ext(16);
+                case 0xd9: value = bytes[pos]; pos += 1; return str(value);
+                case 0xda: value = view.getUint16(pos); pos += 2; return str(value);
+                case 0xdb: value = view.getUint32(pos); pos += 4; return str(value);
+                case 0xdc: value = view.getUint16(pos); pos += 2; return array(value);
+                case 0xdd: value = view.getUint32(pos); pos += 4; return array(value);
+                case 0xde: value = view.getUint16(pos); pos += 2; return map(value);
+                case 0xdf: value = view.getUint32(pos); pos += 4; return map(value);
+            }
+            throw new Error('Invalid MessagePack byte 0x' + byte.toString(16) + ' at ' + (pos - 1));
+        }
+
+        return read();
+    }
+
+    global.MessagePack = { decode: decode };
+})(window);
@@ -4,17 +4,30 @@ import asyncio
 import websockets
 import json
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import threading
+from typing import Dict, Any, Optional, List, Tuple
+import functools
+import mimetypes
+import time
 import webbrowser
 import os
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import socketserver
+import signal
+import socket
 from pathlib import Path
 
+# MessagePack is optional; clients fall back to JSON text frames without it
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson is optional; it encodes the JSON text frames faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the state management classes
-from .state import BravoDeckState, OperationStatus, LabwareType
+from ..state import BravoDeckState, OperationStatus, LabwareType
 
 # Try to import BravoDriver from the correct location
 try:
@@ -34,152 +47,279 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
-    """HTTP handler that doesn't log every request and handles template injection"""
-
-    def __init__(self, *args, ws_port=8765, **kwargs):
-        self.ws_port = ws_port
-        super().__init__(*args, **kwargs)
+def bind_free_port(host: str, start_port: int) -> socket.socket:
+    """Bind start_port if it is free, otherwise a free port from the OS
 
-    def log_message(self, format, *args):
-        # Only log errors
-        if args[1] != "200":
-            super().log_message(format, *args)
-
-    def do_GET(self):
-        # Handle root path and inject WebSocket info
-        if self.path == "/" or self.path == "/index.html":
-            try:
-                # Find index.html in the current directory
-                html_path = os.path.join(os.getcwd(), "index.html")
-                if os.path.exists(html_path):
-                    with open(html_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    # Replace WebSocket URL in the HTML
-                    content = content.replace(
-                        "ws://localhost:8765", f"ws://localhost:{self.ws_port}"
-                    )
-
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
-                    self.send_header("Cache-Control", "no-cache")
-                    self.end_headers()
-                    self.wfile.write(content.encode("utf-8"))
-                    return
-                else:
-                    # If no index.html, show a helpful message
-                    content = f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head><title>Bravo Visualizer</title></head>
-                    <body>
-                        <h1>Bravo Deck Visualizer</h1>
-                        <p>Please save your HTML file as 'index.html' in the same directory as the server.</p>
-                        <p>WebSocket server running on: ws://localhost:{self.ws_port}</p>
-                    </body>
-                    </html>
-                    """
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html")
-                    self.end_headers()
-                    self.wfile.write(content.encode("utf-8"))
-                    return
-            except Exception as e:
-                logger.error(f"Error serving index.html: {e}")
-
-        # For all other requests, use default handler
-        super().do_GET()
-
-
-def find_free_port(start_port: int) -> int:
-    """Find a free port starting from start_port"""
-    import socket
-
-    port = start_port
-    while True:
+    The bound socket is handed to the server as is, so no other process
+    can take the port between the check and the server starting.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Lets a restarted server rebind over TIME_WAIT; on Windows the option
+    # would let it bind over a live listener instead, so it is left off
+    if os.name != "nt":
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("localhost", port))
-                return port
+            s.bind((host, start_port))
         except OSError:
-            port += 1
-            if port > start_port + 100:  # Prevent infinite loop
-                raise RuntimeError(
-                    f"Could not find free port starting from {start_port}"
-                )
-
-
-def start_file_server(directory: str, ws_port: int, http_port: int = 8080):
-    """Start a simple HTTP file server in a separate thread"""
-    original_dir = os.getcwd()
-
+            # Port 0 lets the OS pick any free port in a single bind
+            s.bind((host, 0))
+    except OSError:
+        s.close()
+        raise
+    return s
+
+
+def _render_index(directory: str, ws_port: int) -> bytes:
+    """Load index.html from directory with the WebSocket URL injected"""
+    html_path = os.path.join(directory, "index.html")
+    if os.path.exists(html_path):
+        with open(html_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Replace WebSocket URL in the HTML
+        content = content.replace("ws://localhost:8765", f"ws://localhost:{ws_port}")
+    else:
+        # If no index.html, show a helpful message
+        content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Bravo Visualizer</title></head>
+        <body>
+            <h1>Bravo Deck Visualizer</h1>
+            <p>Please save your HTML file as 'index.html' in the same directory as the server.</p>
+            <p>WebSocket server running on: ws://localhost:{ws_port}</p>
+        </body>
+        </html>
+        """
+    return content.encode("utf-8")
+
+
+def _http_head(status: str, content_type: str, length: int, keep_alive: bool) -> bytes:
+    """Build the status line and headers of an HTTP/1.1 response"""
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {length}\r\n"
+        "Cache-Control: no-cache\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode("latin-1")
+
+
+def _http_response(
+    status: str, content_type: str, body: bytes, keep_alive: bool
+) -> bytes:
+    """Build a complete HTTP/1.1 response"""
+    return _http_head(status, content_type, len(body), keep_alive) + body
+
+
+async def _handle_http_connection(
+    directory: str,
+    index_responses: Tuple[bytes, bytes],
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+):
+    """Answer HTTP GETs for the page or files beside it on one connection"""
+    path = ""
     try:
-        # Change to the specified directory
-        os.chdir(directory)
-
-        # Find a free port
-        free_port = find_free_port(http_port)
-
-        # Create handler with WebSocket port info
-        def handler_factory(*args, **kwargs):
-            return QuietHTTPRequestHandler(*args, ws_port=ws_port, **kwargs)
-
-        httpd = socketserver.TCPServer(("localhost", free_port), handler_factory)
-        logger.info(f"HTTP server running on http://localhost:{free_port}")
-
-        # Open browser after a short delay
-        def open_browser():
-            import time
-
-            time.sleep(1.0)  # Wait for server to be ready
-            url = f"http://localhost:{free_port}"
-            logger.info(f"Opening browser to: {url}")
-            webbrowser.open(url)
-
-        # Start browser opening in background
-        browser_thread = threading.Thread(target=open_browser, daemon=True)
-        browser_thread.start()
-
-        # Serve forever
-        httpd.serve_forever()
-
+        while True:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            if not request_line:
+                break
+
+            # Only the Connection header changes how we respond
+            keep_alive = True
+            while True:
+                header = (await reader.readline()).lower()
+                if header in (b"\r\n", b"\n", b""):
+                    break
+                if header.startswith(b"connection:") and b"close" in header:
+                    keep_alive = False
+
+            path = request_line[1].split("?", 1)[0] if len(request_line) >= 2 else ""
+            name = path.lstrip("/")
+            file_path = os.path.join(directory, name)
+
+            if request_line[0] == "GET" and path in ("/", "/index.html"):
+                writer.write(index_responses[keep_alive])
+            elif (
+                request_line[0] == "GET"
+                and name
+                and "/" not in name
+                and "\\" not in name
+                and os.path.isfile(file_path)
+            ):
+                content_type = (
+                    mimetypes.guess_type(name)[0] or "application/octet-stream"
+                )
+                with open(file_path, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    writer.write(_http_head("200 OK", content_type, size, keep_alive))
+                    await writer.drain()
+                    # Zero-copy where the OS and loop support it, otherwise
+                    # asyncio falls back to reading the file in chunks
+                    await asyncio.get_running_loop().sendfile(writer.transport, f)
+            else:
+                # Only log errors
+                if request_line[0] != "GET":
+                    status = "405 Method Not Allowed"
+                else:
+                    status = "404 Not Found"
+                logger.info("HTTP %s: %s", status, path)
+                writer.write(_http_response(status, "text/plain", b"", keep_alive))
+
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        # Browsers drop idle keep-alive connections whenever they like
+        pass
     except Exception as e:
-        logger.error(f"HTTP server error: {e}")
+        logger.error("Error serving %s: %s", path or "request", e)
     finally:
-        # Always restore original directory
-        os.chdir(original_dir)
+        writer.close()
+
+
+async def start_file_server(
+    directory: str, ws_port: int, http_port: int = 8080
+) -> asyncio.AbstractServer:
+    """Serve the visualizer page from directory on the running event loop"""
+    sock = bind_free_port("localhost", http_port)
+    free_port = sock.getsockname()[1]
+    # The page only depends on the WebSocket port, so build its complete
+    # responses once, indexed by whether the connection is kept alive
+    index = _render_index(directory, ws_port)
+    index_responses = (
+        _http_response("200 OK", "text/html", index, keep_alive=False),
+        _http_response("200 OK", "text/html", index, keep_alive=True),
+    )
+    server = await asyncio.start_server(
+        functools.partial(_handle_http_connection, directory, index_responses),
+        sock=sock,
+    )
+    logger.info("HTTP server running on http://localhost:%s", free_port)
+    return server
+
+
+# Conversions between state enums and the web interface's names
+_LABWARE_TO_WEB = {
+    LabwareType.MICROPLATE_96: "plate-96",
+    LabwareType.MICROPLATE_384: "plate-384",
+    LabwareType.DEEPWELL_96: "plate-96",  # Use similar visual
+    LabwareType.RESERVOIR: "reservoir",
+    LabwareType.TIP_RACK: "tips",
+    LabwareType.EMPTY: "empty",
+    LabwareType.UNKNOWN: "empty",
+}
+
+_STATUS_TO_WEB = {
+    OperationStatus.ASPIRATING: "aspirate",
+    OperationStatus.DISPENSING: "dispense",
+    OperationStatus.MIXING: "mix",
+    OperationStatus.WASHING: "wash",
+    OperationStatus.MOVING: "move",
+    OperationStatus.PICKING: "move",
+    OperationStatus.PLACING: "move",
+    OperationStatus.PUMPING: "dispense",
+    OperationStatus.IDLE: "idle",
+    OperationStatus.ERROR: "error",
+}
+
+_WEB_TO_LABWARE = {
+    "plate-96": LabwareType.MICROPLATE_96,
+    "plate-384": LabwareType.MICROPLATE_384,
+    "tips": LabwareType.TIP_RACK,
+    "reservoir": LabwareType.RESERVOIR,
+    "empty": LabwareType.EMPTY,
+}
+
+if orjson is not None:
+
+    def _json_dumps(message: Dict[str, Any]) -> str:
+        # Deck state is keyed by int nest ids, which orjson rejects by default
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+    # Compact separators match orjson's output and trim every frame
+    _json_dumps = functools.partial(json.dumps, separators=(",", ":"))
+    _json_loads = json.loads
+
+# Web format of a nest with nothing on it. Deck entries are replaced, never
+# mutated, so this can be shared; copy it before changing any field
+_EMPTY_NEST = {
+    "labware": "empty",
+    "volume": 0,
+    "active": False,
+    "labware_name": "",
+    "operation": "idle",
+    "tips_loaded": False,
+}
+
+# JSON frame for send_operation_glow, filled in without the encoder
+_GLOW_PREFIXES = {
+    op: f'{{"type":"{op}_operation","position":'
+    for op in ("aspirate", "dispense", "move")
+}
+
+# Labware placed by setup_default_deck, as (position, type, name)
+_DEFAULT_LAYOUT = (
+    (1, LabwareType.TIP_RACK, "200µL Tips"),
+    (2, LabwareType.MICROPLATE_96, "Source Plate"),
+    (3, LabwareType.MICROPLATE_96, "Destination Plate"),
+    (4, LabwareType.RESERVOIR, "Buffer Reservoir"),
+    (6, LabwareType.MICROPLATE_384, "Assay Plate"),
+    (8, LabwareType.MICROPLATE_96, "Control Plate"),
+    (9, LabwareType.TIP_RACK, "1000µL Tips"),
+)
+
+# Web entries for the default layout; shared like _EMPTY_NEST
+_DEFAULT_WEB_DECK = {
+    position: {
+        **_EMPTY_NEST,
+        "labware": _LABWARE_TO_WEB[labware_type],
+        "volume": 150000 if "Plate" in labware_name else 0,  # Default volumes
+        "labware_name": labware_name,
+    }
+    for position, labware_type, labware_name in _DEFAULT_LAYOUT
+}
+
+# Deck status per simulated operation name; tip operations have no status
+_SIMULATED_OPERATIONS = {
+    "aspirate": OperationStatus.ASPIRATING,
+    "dispense": OperationStatus.DISPENSING,
+    "mix": OperationStatus.MIXING,
+    "wash": OperationStatus.WASHING,
+    "move": OperationStatus.MOVING,
+    "tips_on": OperationStatus.IDLE,
+    "tips_off": OperationStatus.IDLE,
+}
+
+# Minimum seconds between deck broadcasts; bursts within it are coalesced
+DECK_UPDATE_INTERVAL = 1 / 30
 
 
 def labware_type_to_web_format(labware_type: LabwareType) -> str:
     """Convert LabwareType enum to web-compatible format"""
-    mapping = {
-        LabwareType.MICROPLATE_96: "plate-96",
-        LabwareType.MICROPLATE_384: "plate-384",
-        LabwareType.DEEPWELL_96: "plate-96",  # Use similar visual
-        LabwareType.RESERVOIR: "reservoir",
-        LabwareType.TIP_RACK: "tips",
-        LabwareType.EMPTY: "empty",
-        LabwareType.UNKNOWN: "empty",
-    }
-    return mapping.get(labware_type, "empty")
+    return _LABWARE_TO_WEB.get(labware_type, "empty")
 
 
 def operation_status_to_web_format(status: OperationStatus) -> str:
     """Convert OperationStatus enum to web-compatible format"""
-    mapping = {
-        OperationStatus.ASPIRATING: "aspirate",
-        OperationStatus.DISPENSING: "dispense",
-        OperationStatus.MIXING: "mix",
-        OperationStatus.WASHING: "wash",
-        OperationStatus.MOVING: "move",
-        OperationStatus.PICKING: "move",
-        OperationStatus.PLACING: "move",
-        OperationStatus.PUMPING: "dispense",
-        OperationStatus.IDLE: "idle",
-        OperationStatus.ERROR: "error",
+    return _STATUS_TO_WEB.get(status, "idle")
+
+
+def _nest_to_web(nest) -> Dict[str, Any]:
+    """Convert a tracked nest to the web interface's nest format"""
+    status = nest.operation_info.status
+    return {
+        "labware": labware_type_to_web_format(nest.labware_type),
+        "volume": int(max(0, nest.volume_info.current_volume)),
+        "active": status != OperationStatus.IDLE,
+        "labware_name": nest.labware_name or "",
+        "operation": operation_status_to_web_format(status),
+        "tips_loaded": nest.tip_info.tips_loaded,
     }
-    return mapping.get(status, "idle")
 
 
 class BravoDeckVisualizerWithState:
@@ -190,10 +330,16 @@ class BravoDeckVisualizerWithState:
         host: str = "localhost",
         port: int = 8765,
         bravo_driver: Optional[BravoDriver] = None,
+        animation_delay: float = 1.5,
     ):
         self.host = host
         self.port = port
+        # Seconds a simulated operation stays active before completing
+        self.animation_delay = animation_delay
         self.clients = set()
+        # Connected clients, also partitioned by the frame format they receive
+        self.json_clients = set()
+        self.msgpack_clients = set()
 
         # Initialize or use provided Bravo driver
         self.bravo_driver = bravo_driver
@@ -212,42 +358,56 @@ class BravoDeckVisualizerWithState:
             self.deck_state = BravoDeckState()
 
         # Legacy simple deck state for backward compatibility
-        self.simple_deck_state = {
-            i: {"labware": "empty", "volume": 0, "active": False} for i in range(1, 10)
-        }
+        self.simple_deck_state = {i: _EMPTY_NEST for i in range(1, 10)}
+        # Nests changed since their web entries were last refreshed
+        self._dirty_positions = set(range(1, 10))
+        # Nest-derived state_info counts, cleared whenever a nest changes
+        self._nest_counts: Optional[Dict[str, int]] = None
+        self.deck_state.add_change_listener(self._mark_dirty)
 
         self.current_operation = "Ready"
 
+        # Deck and state_info last broadcast, to skip unchanged updates
+        self._last_broadcast: Optional[tuple] = None
+        # Pending coalesced deck broadcast, if one is scheduled
+        self._update_task: Optional[asyncio.Task] = None
+
         # Sync initial state
         self._sync_state_to_simple_format()
 
+    def _mark_dirty(self, nest_id: int):
+        """Note that a nest changed in the state tracker"""
+        self._dirty_positions.add(nest_id)
+        self._nest_counts = None
+
+    def _get_state_info(self) -> Dict[str, Any]:
+        """Deck counters for the web interface, rescanning nests only on change"""
+        deck_state = self.deck_state
+        if self._nest_counts is None:
+            self._nest_counts = {
+                "active_operations": len(deck_state.get_active_operations()),
+                "nests_with_labware": len(deck_state.get_nests_with_labware()),
+                "nests_with_tips": len(deck_state.get_nests_with_tips()),
+            }
+        # Errors can be logged without touching a nest, so always read these
+        return {
+            **self._nest_counts,
+            "total_operations": deck_state.global_operation_count,
+            "error_count": deck_state.error_count,
+        }
+
     def _sync_state_to_simple_format(self):
-        """Sync the BravoDeckState to simple format for web interface"""
-        if not self.deck_state:
+        """Sync changed nests of the BravoDeckState to the web format"""
+        if not self.deck_state or not self._dirty_positions:
             return
 
-        for nest_id in range(1, 10):
-            nest = self.deck_state.get_nest(nest_id)
-            if nest:
-                # Convert labware type
-                web_labware = labware_type_to_web_format(nest.labware_type)
-
-                # Calculate total volume (current + dispensed)
-                total_volume = max(0, nest.volume_info.current_volume)
-
-                # Check if operation is active
-                is_active = nest.operation_info.status != OperationStatus.IDLE
-
-                self.simple_deck_state[nest_id] = {
-                    "labware": web_labware,
-                    "volume": int(total_volume),
-                    "active": is_active,
-                    "labware_name": nest.labware_name or "",
-                    "operation": operation_status_to_web_format(
-                        nest.operation_info.status
-                    ),
-                    "tips_loaded": nest.tip_info.tips_loaded,
-                }
+        dirty, self._dirty_positions = self._dirty_positions, set()
+        get_nest = self.deck_state.get_nest
+        for nest_id in dirty:
+            # Nests the state tracker doesn't know keep their last web entry
+            nest = get_nest(nest_id)
+            if nest and nest_id in self.simple_deck_state:
+                self.simple_deck_state[nest_id] = _nest_to_web(nest)
 
     def _sync_simple_to_state_format(self, nest_id: int, simple_data: dict):
         """Sync changes from simple format back to BravoDeckState"""
@@ -259,15 +419,7 @@ class BravoDeckVisualizerWithState:
             return
 
         # Convert web format back to enum
-        web_to_labware = {
-            "plate-96": LabwareType.MICROPLATE_96,
-            "plate-384": LabwareType.MICROPLATE_384,
-            "tips": LabwareType.TIP_RACK,
-            "reservoir": LabwareType.RESERVOIR,
-            "empty": LabwareType.EMPTY,
-        }
-
-        labware_type = web_to_labware.get(
+        labware_type = _WEB_TO_LABWARE.get(
             simple_data.get("labware", "empty"), LabwareType.EMPTY
         )
         labware_name = simple_data.get("labware_name", "")
@@ -277,13 +429,17 @@ class BravoDeckVisualizerWithState:
 
         # Update volume if provided
         if "volume" in simple_data:
-            current_vol = simple_data["volume"]
-            nest.volume_info.current_volume = current_vol
+            nest.set_volume(simple_data["volume"])
 
     async def register_client(self, websocket):
         """Register a new client"""
+        # Broadcast any change still waiting for the coalesced flush before
+        # this client joins, so it never gets a patch for a deck it lacks
+        if self._last_broadcast is not None:
+            await self.send_deck_update()
         self.clients.add(websocket)
-        logger.info(f"Client connected. Total: {len(self.clients)}")
+        self.json_clients.add(websocket)
+        logger.info("Client connected. Total: %s", len(self.clients))
 
         # Send current state to new client
         await self.send_deck_update(websocket)
@@ -291,67 +447,137 @@ class BravoDeckVisualizerWithState:
     async def unregister_client(self, websocket):
         """Unregister a client"""
         self.clients.discard(websocket)
-        logger.info(f"Client disconnected. Total: {len(self.clients)}")
+        self.json_clients.discard(websocket)
+        self.msgpack_clients.discard(websocket)
+        logger.info("Client disconnected. Total: %s", len(self.clients))
 
     async def send_message(self, websocket, message: Dict[str, Any]):
         """Send message to specific client"""
         try:
-            await websocket.send(json.dumps(message))
+            if websocket in self.msgpack_clients:
+                await websocket.send(msgpack.packb(message))
+            else:
+                await websocket.send(_json_dumps(message))
         except websockets.exceptions.ConnectionClosed:
             await self.unregister_client(websocket)
 
-    async def broadcast_message(self, message: Dict[str, Any]):
-        """Broadcast to all clients"""
+    async def broadcast_message(
+        self, message: Dict[str, Any], json_text: Optional[str] = None
+    ):
+        """Broadcast to all clients, sending json_text to JSON clients if given"""
         if not self.clients:
             return
 
-        disconnected = set()
-        for client in self.clients.copy():
-            try:
-                await client.send(json.dumps(message))
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.add(client)
-
-        # Remove disconnected clients
-        for client in disconnected:
-            await self.unregister_client(client)
+        # Encode once per format and fan the same frame out without awaiting
+        # each client; closed connections are skipped and get unregistered
+        # by client_handler when their connection ends
+        if self.msgpack_clients:
+            websockets.broadcast(self.msgpack_clients, msgpack.packb(message))
+        if self.json_clients:
+            websockets.broadcast(self.json_clients, json_text or _json_dumps(message))
 
     async def send_deck_update(self, websocket=None):
         """Send deck state update"""
+        if websocket is not None and self._last_broadcast is not None:
+            # Patches are diffed against the last broadcast, so a targeted
+            # snapshot must be exactly that: bring every client up to date
+            # first, then send the same deck to this one
+            await self.send_deck_update()
+            deck, state_info = self._last_broadcast
+            message = {
+                "type": "deck_update",
+                "deck": deck,
+                "timestamp": time.time(),
+            }
+            if state_info is not None:
+                message["state_info"] = state_info
+            await self.send_message(websocket, message)
+            return
+
         # Sync state before sending
         self._sync_state_to_simple_format()
+        state_info = self._get_state_info() if self.deck_state else None
+
+        last = self._last_broadcast
+        if websocket is None and last is not None:
+            # Clients already hold the last broadcast (targeted snapshots
+            # send exactly that deck), so only changed nest fields are sent.
+            # Nothing is allocated until a change is found.
+            last_deck, last_state_info = last
+            changes = {}
+            for position, nest in self.simple_deck_state.items():
+                previous = last_deck.get(position)
+                if nest is previous or nest == previous:
+                    continue
+                if previous is None:
+                    changes[position] = nest
+                else:
+                    changes[position] = {
+                        key: value
+                        for key, value in nest.items()
+                        if previous.get(key) != value
+                    }
+
+            if not changes and state_info == last_state_info:
+                return
+            # Nest entries are replaced rather than mutated on change, so a
+            # shallow copy is enough to compare against the next update
+            self._last_broadcast = (dict(self.simple_deck_state), state_info)
+
+            patch = {
+                "type": "deck_patch",
+                "changes": changes,
+                "timestamp": time.time(),
+            }
+            if state_info != last_state_info:
+                patch["state_info"] = state_info
+            await self.broadcast_message(patch)
+            return
 
         # Enhanced message with state information
         message = {
             "type": "deck_update",
             "deck": self.simple_deck_state,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
         }
 
         # Add state summary if available
-        if self.deck_state:
-            deck_summary = self.deck_state.get_deck_summary()
-            message["state_info"] = {
-                "active_operations": len(self.deck_state.get_active_operations()),
-                "nests_with_labware": len(self.deck_state.get_nests_with_labware()),
-                "nests_with_tips": len(self.deck_state.get_nests_with_tips()),
-                "total_operations": deck_summary["deck_info"]["global_operation_count"],
-                "error_count": deck_summary["deck_info"]["error_count"],
-            }
+        if state_info is not None:
+            message["state_info"] = state_info
 
         if websocket:
             await self.send_message(websocket, message)
-        else:
-            await self.broadcast_message(message)
+            return
+
+        self._last_broadcast = (dict(self.simple_deck_state), state_info)
+        await self.broadcast_message(message)
+
+    def _schedule_deck_update(self):
+        """Schedule a deck broadcast, merging requests within one interval"""
+        if self._update_task is None:
+            self._update_task = asyncio.create_task(self._flush_deck_update())
+
+    async def _flush_deck_update(self):
+        """Broadcast the latest deck state once the update interval elapses"""
+        await asyncio.sleep(DECK_UPDATE_INTERVAL)
+        self._update_task = None
+        await self.send_deck_update()
 
     async def send_operation_glow(self, position: int, operation_type: str):
         """Send glow effect for operation"""
+        timestamp = time.time()
         message = {
             "type": f"{operation_type}_operation",
             "position": position,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
-        await self.broadcast_message(message)
+        # Glow types, int positions and float timestamps never need escaping,
+        # so known-good values skip the JSON encoder
+        json_text = None
+        prefix = _GLOW_PREFIXES.get(operation_type)
+        if prefix is not None and type(position) is int:
+            json_text = f'{prefix}{position},"timestamp":{timestamp!r}}}'
+        await self.broadcast_message(message, json_text)
 
     async def broadcast_operation(self, operation: str, details: str = ""):
         """Broadcast operation status"""
@@ -360,40 +586,22 @@ class BravoDeckVisualizerWithState:
             "type": "operation",
             "operation": operation,
             "details": details,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
         }
         await self.broadcast_message(message)
 
     async def setup_default_deck(self):
         """Setup default labware layout using state management"""
-        default_layout = [
-            (1, LabwareType.TIP_RACK, "200µL Tips"),
-            (2, LabwareType.MICROPLATE_96, "Source Plate"),
-            (3, LabwareType.MICROPLATE_96, "Destination Plate"),
-            (4, LabwareType.RESERVOIR, "Buffer Reservoir"),
-            (6, LabwareType.MICROPLATE_384, "Assay Plate"),
-            (8, LabwareType.MICROPLATE_96, "Control Plate"),
-            (9, LabwareType.TIP_RACK, "1000µL Tips"),
-        ]
-
-        for position, labware_type, labware_name in default_layout:
-            if self.deck_state:
+        if self.deck_state:
+            for position, labware_type, labware_name in _DEFAULT_LAYOUT:
                 self.deck_state.set_labware_at_nest(
                     position, labware_type.value, labware_name
                 )
 
-            # Also update simple state for immediate visual update
-            web_labware = labware_type_to_web_format(labware_type)
-            self.simple_deck_state[position] = {
-                "labware": web_labware,
-                "volume": 150000 if "Plate" in labware_name else 0,  # Default volumes
-                "active": False,
-                "labware_name": labware_name,
-                "operation": "idle",
-                "tips_loaded": False,
-            }
+        # Also update simple state for immediate visual update
+        self.simple_deck_state.update(_DEFAULT_WEB_DECK)
 
-        await self.send_deck_update()
+        self._schedule_deck_update()
 
     async def simulate_operation_with_state(
         self, operation: str, position: int, volume: float = 0, **kwargs
@@ -404,23 +612,10 @@ class BravoDeckVisualizerWithState:
         if self.deck_state:
             operation_details = {"volume": volume, **kwargs}
 
-            # Map operation names to OperationStatus
-            op_mapping = {
-                "aspirate": OperationStatus.ASPIRATING,
-                "dispense": OperationStatus.DISPENSING,
-                "mix": OperationStatus.MIXING,
-                "wash": OperationStatus.WASHING,
-                "move": OperationStatus.MOVING,
-                "tips_on": OperationStatus.IDLE,  # Tips operations don't have separate status
-                "tips_off": OperationStatus.IDLE,
-            }
-
-            if (
-                operation in op_mapping
-                and op_mapping[operation] != OperationStatus.IDLE
-            ):
+            status = _SIMULATED_OPERATIONS.get(operation, OperationStatus.IDLE)
+            if status != OperationStatus.IDLE:
                 self.deck_state.start_operation_at_nest(
-                    position, operation, operation_details
+                    position, status, operation_details
                 )
 
                 # Update volumes
@@ -451,26 +646,34 @@ class BravoDeckVisualizerWithState:
             f"{volume} µL" if volume > 0 else "",
         )
 
-        # Sync and update deck state
-        self._sync_state_to_simple_format()
-        await self.send_deck_update()
-        await asyncio.sleep(1.5)
+        # Changed nests are synced when the update is sent
+        self._schedule_deck_update()
+        await asyncio.sleep(self.animation_delay)
 
         # Complete operation in state management
         if self.deck_state:
             self.deck_state.complete_operation_at_nest(position)
-            self._sync_state_to_simple_format()
-            await self.send_deck_update()
+            self._schedule_deck_update()
 
     async def handle_client_message(self, websocket, message: str):
         """Handle incoming client messages"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             command = data.get("command")
 
             if command == "get_state":
                 await self.send_deck_update(websocket)
 
+            elif command == "set_format":
+                # Binary frames are only used when msgpack is installed here
+                if data.get("format") == "msgpack" and msgpack is not None:
+                    self.json_clients.discard(websocket)
+                    self.msgpack_clients.add(websocket)
+                else:
+                    self.msgpack_clients.discard(websocket)
+                    self.json_clients.add(websocket)
+                await self.send_deck_update(websocket)
+
             elif command == "get_detailed_state":
                 # Send detailed state information
                 if self.deck_state:
@@ -478,7 +681,7 @@ class BravoDeckVisualizerWithState:
                     message = {
                         "type": "detailed_state",
                         "state": detailed_state,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": time.time(),
                     }
                     await self.send_message(websocket, message)
 
@@ -510,28 +713,20 @@ class BravoDeckVisualizerWithState:
                     position, {"labware": labware_type, "labware_name": labware_name}
                 )
 
-                await self.send_deck_update()
+                self._schedule_deck_update()
 
             elif command == "reset_deck":
                 if self.deck_state:
                     self.deck_state.reset_all_nests()
 
-                for i in range(1, 10):
-                    self.simple_deck_state[i] = {
-                        "labware": "empty",
-                        "volume": 0,
-                        "active": False,
-                        "labware_name": "",
-                        "operation": "idle",
-                        "tips_loaded": False,
-                    }
+                self.simple_deck_state = {i: _EMPTY_NEST for i in range(1, 10)}
 
-                await self.send_deck_update()
+                self._schedule_deck_update()
 
         except json.JSONDecodeError:
-            logger.error(f"Invalid JSON: {message}")
+            logger.error("Invalid JSON: %s", message)
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
 
     async def simulate_transfer_with_state(
         self, from_pos: int, to_pos: int, volume: float
@@ -563,20 +758,35 @@ class BravoDeckVisualizerWithState:
         await self.broadcast_operation("Demo starting...")
         await asyncio.sleep(1)
 
-        # Demo operations with realistic liquid handling workflow
-        operations = [
-            ("tips_on", 1, 0, {"tip_type": "200µL"}),
-            ("aspirate", 2, 100, {}),  # From source plate
-            ("dispense", 3, 100, {}),  # To destination plate
-            ("aspirate", 4, 50, {}),  # Buffer from reservoir
-            ("dispense", 6, 50, {}),  # To assay plate
-            ("wash", 4, 200, {"cycles": 3}),  # Wash tips
-            ("tips_off", 9, 0, {}),  # Dispose tips
+        # Demo operations with realistic liquid handling workflow. Operations
+        # in one step touch different positions and run concurrently; each
+        # aspirate still comes a step before its dispense
+        steps = [
+            [("tips_on", 1, 0, {"tip_type": "200µL"})],
+            [
+                ("aspirate", 2, 100, {}),  # From source plate
+                ("aspirate", 4, 50, {}),  # Buffer from reservoir
+            ],
+            [
+                ("dispense", 3, 100, {}),  # To destination plate
+                ("dispense", 6, 50, {}),  # To assay plate
+            ],
+            [
+                ("wash", 4, 200, {"cycles": 3}),  # Wash tips
+                ("tips_off", 9, 0, {}),  # Dispose tips
+            ],
         ]
 
-        for i, (op, pos, vol, extra_kwargs) in enumerate(operations):
-            await self.broadcast_operation(f"Step {i+1}: {op}")
-            await self.simulate_operation_with_state(op, pos, vol, **extra_kwargs)
+        for i, step in enumerate(steps):
+            await self.broadcast_operation(
+                f"Step {i+1}: {' + '.join(op for op, *_ in step)}"
+            )
+            await asyncio.gather(
+                *(
+                    self.simulate_operation_with_state(op, pos, vol, **extra_kwargs)
+                    for op, pos, vol, extra_kwargs in step
+                )
+            )
             await asyncio.sleep(1)
 
         await self.broadcast_operation("Demo complete! 🎉")
@@ -593,54 +803,70 @@ class BravoDeckVisualizerWithState:
 
         # Find free WebSocket port
         original_ws_port = self.port
-        self.port = find_free_port(self.port)
+        ws_sock = bind_free_port(self.host, self.port)
+        self.port = ws_sock.getsockname()[1]
         if self.port != original_ws_port:
             logger.info(
-                f"WebSocket port {original_ws_port} in use, using {self.port} instead"
+                "WebSocket port %s in use, using %s instead",
+                original_ws_port,
+                self.port,
             )
 
         # Setup default deck layout when server starts
         await self.setup_default_deck()
 
-        # Start HTTP file server if requested
+        # Start HTTP file server on this event loop if requested
+        http_server = None
         if serve_files:
             script_dir = Path(__file__).parent
-            logger.info(f"Starting HTTP server from directory: {script_dir}")
-
-            # Start HTTP server in background thread
-            http_thread = threading.Thread(
-                target=start_file_server,
-                args=(str(script_dir), self.port, http_port),
-                daemon=True,
-            )
-            http_thread.start()
-
-            # Give HTTP server time to start
-            await asyncio.sleep(1.5)
+            logger.info("Starting HTTP server from directory: %s", script_dir)
+            http_server = await start_file_server(str(script_dir), self.port, http_port)
 
         # Start WebSocket server
-        logger.info(f"Starting WebSocket server on ws://{self.host}:{self.port}")
+        logger.info("Starting WebSocket server on ws://%s:%s", self.host, self.port)
 
-        async with websockets.serve(self.client_handler, self.host, self.port):
-            logger.info(f"✅ WebSocket server ready on ws://{self.host}:{self.port}")
+        # Updates are small and frequent, so per-message deflate would cost
+        # more CPU and latency than it saves in bytes
+        async with websockets.serve(
+            self.client_handler, sock=ws_sock, compression=None
+        ):
+            logger.info("✅ WebSocket server ready on ws://%s:%s", self.host, self.port)
 
-            if not serve_files:
+            if http_server is None:
                 logger.info("💡 Open index.html in your browser and click Connect")
             else:
-                logger.info("🌐 Browser should open automatically")
+                # Both servers are listening, so the page can connect at once
+                url = f"http://localhost:{http_server.sockets[0].getsockname()[1]}"
+                logger.info("🌐 Opening browser to: %s", url)
+                asyncio.get_running_loop().run_in_executor(None, webbrowser.open, url)
 
             if run_demo:
                 logger.info("🎬 Starting demo in 3 seconds...")
                 await asyncio.sleep(3)
                 asyncio.create_task(self.run_demo())
 
+            # Keep the server running without waking the loop while idle
+            loop = asyncio.get_running_loop()
+            stop = loop.create_future()
+            try:
+                loop.add_signal_handler(signal.SIGINT, stop.set_result, None)
+                sigint_handled = True
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Windows loops have no signal handlers, and loops off the
+                # main thread (the embedded server) can't install them; Ctrl-C
+                # still raises KeyboardInterrupt in the main thread
+                sigint_handled = False
+
             try:
-                # Keep the server running
-                while True:
-                    await asyncio.sleep(1)
+                await stop
             except KeyboardInterrupt:
+                pass
+            finally:
                 logger.info("🛑 Server stopping...")
-                return
+                if sigint_handled:
+                    loop.remove_signal_handler(signal.SIGINT)
+                if http_server is not None:
+                    http_server.close()
 
 
 def main():
@@ -654,13 +880,30 @@ def main():
     parser.add_argument("--port", type=int, default=8765, help="WebSocket port number")
     parser.add_argument("--http-port", type=int, default=8080, help="HTTP server port")
     parser.add_argument("--demo", action="store_true", help="Run demo sequence")
+    parser.add_argument(
+        "--animation-delay",
+        type=float,
+        default=1.5,
+        help="Seconds each simulated operation stays active",
+    )
     parser.add_argument(
         "--serve", action="store_true", help="Start HTTP file server and open browser"
     )
 
     args = parser.parse_args()
 
-    visualizer = BravoDeckVisualizerWithState(host=args.host, port=args.port)
+    visualizer = BravoDeckVisualizerWithState(
+        host=args.host, port=args.port, animation_delay=args.animation_delay
+    )
+
+    # uvloop is optional and not available on Windows; the default loop works
+    # everywhere, uvloop just makes each await cheaper where it is installed
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
     try:
         asyncio.run(
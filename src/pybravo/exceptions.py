@@ -19,3 +19,9 @@ class BravoCommandError(BravoError):
     """Raised when a command to the device fails"""
 
     pass
+
+
+class BravoTimeoutError(BravoCommandError):
+    """Raised when the device does not report a command finished in time"""
+
+    pass
@@ -4,8 +4,51 @@ Script to export all Velocity11 labware registry data
 
 import winreg
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson is optional; it pretty-prints large exports much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Display names for the registry value types labware entries use
+_REG_TYPE_NAMES = {
+    winreg.REG_SZ: "REG_SZ",
+    winreg.REG_DWORD: "REG_DWORD",
+    winreg.REG_BINARY: "REG_BINARY",
+}
+
+# Entries are read in parallel; each registry call releases the GIL
+_READ_WORKERS = 16
+
+
+def _read_entry_values(entry_path):
+    """Read (name, value, type) for every value of one labware entry"""
+    with winreg.OpenKey(
+        winreg.HKEY_LOCAL_MACHINE, entry_path, 0, winreg.KEY_READ
+    ) as entry_key:
+        num_values = winreg.QueryInfoKey(entry_key)[1]
+        return [winreg.EnumValue(entry_key, j) for j in range(num_values)]
+
+
+def _read_all_entries(base_path):
+    """Read every labware entry under base_path, in registry order"""
+    with winreg.OpenKey(
+        winreg.HKEY_LOCAL_MACHINE, base_path, 0, winreg.KEY_READ
+    ) as base_key:
+        num_entries = winreg.QueryInfoKey(base_key)[0]
+        entry_names = [winreg.EnumKey(base_key, i) for i in range(num_entries)]
+
+    # Each worker opens its own handle, so no key is shared across threads
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        values = pool.map(
+            _read_entry_values,
+            [f"{base_path}\\{entry_name}" for entry_name in entry_names],
+        )
+        return list(zip(entry_names, values))
+
 
 def export_all_labware_data():
     """Export all labware registry data to a text file"""
@@ -15,48 +58,17 @@ def export_all_labware_data():
     )
 
     try:
-        with winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE, base_path, 0, winreg.KEY_READ
-        ) as base_key:
-            with open(output_file, "w") as f:
-                f.write("VELOCITY11 LABWARE REGISTRY EXPORT\n")
-                f.write("=" * 50 + "\n\n")
-
-                # Enumerate all labware entries
-                i = 0
-                while True:
-                    try:
-                        entry_name = winreg.EnumKey(base_key, i)
-                        f.write(f"ENTRY: {entry_name}\n")
-                        f.write("-" * 30 + "\n")
-
-                        # Open the specific entry
-                        entry_path = f"{base_path}\\{entry_name}"
-                        with winreg.OpenKey(
-                            winreg.HKEY_LOCAL_MACHINE, entry_path, 0, winreg.KEY_READ
-                        ) as entry_key:
-                            # Enumerate all values in this entry
-                            j = 0
-                            while True:
-                                try:
-                                    name, value, reg_type = winreg.EnumValue(
-                                        entry_key, j
-                                    )
-                                    type_str = {
-                                        winreg.REG_SZ: "REG_SZ",
-                                        winreg.REG_DWORD: "REG_DWORD",
-                                        winreg.REG_BINARY: "REG_BINARY",
-                                    }.get(reg_type, f"REG_TYPE_{reg_type}")
-
-                                    f.write(f"  {name}: {value} ({type_str})\n")
-                                    j += 1
-                                except WindowsError:
-                                    break
-
-                        f.write("\n")
-                        i += 1
-                    except WindowsError:
-                        break
+        lines = ["VELOCITY11 LABWARE REGISTRY EXPORT\n", "=" * 50 + "\n\n"]
+        for entry_name, values in _read_all_entries(base_path):
+            lines.append(f"ENTRY: {entry_name}\n")
+            lines.append("-" * 30 + "\n")
+            for name, value, reg_type in values:
+                type_str = _REG_TYPE_NAMES.get(reg_type, f"REG_TYPE_{reg_type}")
+                lines.append(f"  {name}: {value} ({type_str})\n")
+            lines.append("\n")
+
+        with open(output_file, "w") as f:
+            f.writelines(lines)
 
         print(f"Registry data exported to: {output_file}")
         return output_file
@@ -72,41 +84,19 @@ def export_to_json():
     output_file = (
         f"labware_registry_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     )
-    all_data = {}
 
     try:
-        with winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE, base_path, 0, winreg.KEY_READ
-        ) as base_key:
-            # Enumerate all labware entries
-            i = 0
-            while True:
-                try:
-                    entry_name = winreg.EnumKey(base_key, i)
-                    entry_data = {}
-
-                    # Open the specific entry
-                    entry_path = f"{base_path}\\{entry_name}"
-                    with winreg.OpenKey(
-                        winreg.HKEY_LOCAL_MACHINE, entry_path, 0, winreg.KEY_READ
-                    ) as entry_key:
-                        # Enumerate all values in this entry
-                        j = 0
-                        while True:
-                            try:
-                                name, value, reg_type = winreg.EnumValue(entry_key, j)
-                                entry_data[name] = value
-                                j += 1
-                            except WindowsError:
-                                break
-
-                    all_data[entry_name] = entry_data
-                    i += 1
-                except WindowsError:
-                    break
-
-        with open(output_file, "w") as f:
-            json.dump(all_data, f, indent=2, default=str)
+        all_data = {
+            entry_name: {name: value for name, value, _ in values}
+            for entry_name, values in _read_all_entries(base_path)
+        }
+
+        if orjson is not None:
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(all_data, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, "w") as f:
+                json.dump(all_data, f, indent=2, default=str)
 
         print(f"Registry data exported to JSON: {output_file}")
         return output_file
@@ -1,10 +1,13 @@
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Set, Union
 import logging
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import threading
 
+logger = logging.getLogger(__name__)
+
 
 class OperationStatus(Enum):
     """Enumeration of possible operation statuses"""
@@ -95,7 +98,13 @@ class OperationInfo:
 
 @dataclass
 class Nest:
-    """Represents a single nest position on the Bravo deck"""
+    """Represents a single nest position on the Bravo deck
+
+    Change a nest through its methods. The owning deck's column arrays and
+    labware-type index are only refreshed when a method calls _notify(), so
+    assigning fields directly (e.g. ``nest.volume_info.current_volume = x``)
+    leaves them stale until the next notifying call.
+    """
 
     nest_id: int
     labware_type: LabwareType = LabwareType.EMPTY
@@ -105,6 +114,10 @@ class Nest:
     operation_info: OperationInfo = field(default_factory=OperationInfo)
     custom_properties: Dict[str, Any] = field(default_factory=dict)
     last_accessed: Optional[datetime] = None
+    # Called after every mutation so the owning deck can refresh its columns.
+    # Left unannotated so it is not a dataclass field: it stays out of
+    # __init__, repr, comparisons and asdict()/astuple()
+    _on_change = None
 
     def __post_init__(self):
         """Initialize after dataclass creation"""
@@ -115,6 +128,11 @@ class Nest:
         if self.operation_info is None:
             self.operation_info = OperationInfo()
 
+    def _notify(self):
+        """Tell the owning deck that this nest changed"""
+        if self._on_change is not None:
+            self._on_change(self)
+
     def set_labware(
         self, labware_type: LabwareType, labware_name: Optional[str] = None
     ):
@@ -122,7 +140,9 @@ class Nest:
         self.labware_type = labware_type
         self.labware_name = labware_name
         self.last_accessed = datetime.now()
-        logging.info(f"Nest {self.nest_id}: Set labware to {labware_type.value}")
+        self._notify()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Nest %s: Set labware to %s", self.nest_id, labware_type.value)
 
     def start_operation(
         self, operation: OperationStatus, details: Dict[str, Any] = None
@@ -130,14 +150,20 @@ class Nest:
         """Start an operation on this nest"""
         self.operation_info.start_operation(operation, details)
         self.last_accessed = datetime.now()
-        logging.info(f"Nest {self.nest_id}: Started {operation.value} operation")
+        self._notify()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Nest %s: Started %s operation", self.nest_id, operation.value)
 
     def complete_operation(self):
         """Complete the current operation"""
         operation = self.operation_info.status
         self.operation_info.complete_operation()
         self.last_accessed = datetime.now()
-        logging.info(f"Nest {self.nest_id}: Completed {operation.value} operation")
+        self._notify()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Nest %s: Completed %s operation", self.nest_id, operation.value
+            )
 
     def update_volume(self, aspirated: float = 0, dispensed: float = 0):
         """Update volume information"""
@@ -148,6 +174,13 @@ class Nest:
         self.volume_info.current_volume += aspirated - dispensed
         self.volume_info.last_operation_volume = max(aspirated, dispensed)
         self.last_accessed = datetime.now()
+        self._notify()
+
+    def set_volume(self, volume: float):
+        """Overwrite the current volume"""
+        self.volume_info.current_volume = volume
+        self.last_accessed = datetime.now()
+        self._notify()
 
     def update_tips(
         self, tips_on: bool = False, tip_type: str = None, tip_count: int = 0
@@ -160,6 +193,7 @@ class Nest:
             self.tip_info.tip_count = tip_count
         self.tip_info.last_tip_operation = "tips_on" if tips_on else "tips_off"
         self.last_accessed = datetime.now()
+        self._notify()
 
     def reset_nest(self):
         """Reset nest to empty state"""
@@ -170,6 +204,7 @@ class Nest:
         self.operation_info.complete_operation()
         self.custom_properties.clear()
         self.last_accessed = datetime.now()
+        self._notify()
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the nest state"""
@@ -193,6 +228,25 @@ class BravoDeckState:
         self.num_nests = num_nests
         self.nests: Dict[int, Nest] = {}
         self._lock = threading.RLock()  # Thread-safe operations
+
+        # Struct-of-arrays view of the hot per-nest fields, indexed by nest ID.
+        # Slot 0 is unused so it never matches a query.
+        self._labware_types: List[Optional[LabwareType]] = [None] + [
+            LabwareType.EMPTY
+        ] * num_nests
+        self._volumes = array("d", [0.0]) * (num_nests + 1)
+        self._tips_loaded = bytearray(num_nests + 1)
+        self._busy = bytearray(num_nests + 1)
+        # The nests themselves, by the same index, for lookups by ID
+        self._nest_slots: List[Optional[Nest]] = [None] * (num_nests + 1)
+        # Inverted index of nest IDs per labware type, so lookups by type
+        # do not scan the deck
+        self._by_type: Dict[LabwareType, Set[int]] = {t: set() for t in LabwareType}
+        self._by_type[LabwareType.EMPTY].update(range(1, num_nests + 1))
+
+        # Callbacks given the ID of every nest that changes
+        self._change_listeners: List[Callable[[int], None]] = []
+
         self._initialize_nests()
 
         # Global state tracking
@@ -201,20 +255,42 @@ class BravoDeckState:
         self.last_error: Optional[str] = None
         self.initialization_time = datetime.now()
 
-        logging.info(f"BravoDeckState initialized with {num_nests} nests")
+        logger.info("BravoDeckState initialized with %s nests", num_nests)
 
     def _initialize_nests(self):
         """Initialize all nests"""
         with self._lock:
             for i in range(1, self.num_nests + 1):
-                self.nests[i] = Nest(nest_id=i)
+                nest = Nest(nest_id=i)
+                nest._on_change = self._sync_nest_columns
+                self.nests[i] = nest
+                self._nest_slots[i] = nest
+                self._sync_nest_columns(nest)
+
+    def _sync_nest_columns(self, nest: Nest):
+        """Copy a nest's hot fields into the column arrays"""
+        i = nest.nest_id
+        old_type = self._labware_types[i]
+        if old_type is not nest.labware_type:
+            self._by_type[old_type].discard(i)
+            self._by_type[nest.labware_type].add(i)
+        self._labware_types[i] = nest.labware_type
+        self._volumes[i] = nest.volume_info.current_volume
+        self._tips_loaded[i] = nest.tip_info.tips_loaded
+        self._busy[i] = nest.operation_info.status != OperationStatus.IDLE
+        for callback in self._change_listeners:
+            callback(i)
+
+    def add_change_listener(self, callback: Callable[[int], None]):
+        """Call ``callback(nest_id)`` after every change to a nest"""
+        self._change_listeners.append(callback)
 
     def get_nest(self, nest_id: int) -> Optional[Nest]:
         """Get a specific nest by ID"""
-        if not (1 <= nest_id <= self.num_nests):
-            logging.error(f"Invalid nest ID: {nest_id}")
-            return None
-        return self.nests.get(nest_id)
+        if 1 <= nest_id <= self.num_nests:
+            return self._nest_slots[nest_id]
+        logger.error("Invalid nest ID: %s", nest_id)
+        return None
 
     def set_labware_at_nest(
         self, nest_id: int, labware_type: str, labware_name: str = None
@@ -228,8 +304,8 @@ class BravoDeckState:
                     labware_enum = LabwareType(labware_type.lower())
                 except ValueError:
                     labware_enum = LabwareType.UNKNOWN
-                    logging.warning(
-                        f"Unknown labware type: {labware_type}, using UNKNOWN"
+                    logger.warning(
+                        "Unknown labware type: %s, using UNKNOWN", labware_type
                     )
 
                 nest.set_labware(labware_enum, labware_name)
@@ -237,19 +313,25 @@ class BravoDeckState:
             return False
 
     def start_operation_at_nest(
-        self, nest_id: int, operation: str, details: Dict[str, Any] = None
+        self,
+        nest_id: int,
+        operation: Union[str, OperationStatus],
+        details: Dict[str, Any] = None,
     ):
         """Start an operation at a specific nest"""
         with self._lock:
             nest = self.get_nest(nest_id)
             if nest:
                 try:
-                    operation_enum = OperationStatus(operation.lower())
+                    if isinstance(operation, OperationStatus):
+                        operation_enum = operation
+                    else:
+                        operation_enum = OperationStatus(operation.lower())
                     nest.start_operation(operation_enum, details or {})
                     self.global_operation_count += 1
                     return True
                 except ValueError:
-                    logging.error(f"Unknown operation: {operation}")
+                    logger.error("Unknown operation: %s", operation)
                     return False
             return False
 
@@ -286,8 +368,9 @@ class BravoDeckState:
         """Get all nests with active operations"""
         with self._lock:
             active_ops = []
-            for nest in self.nests.values():
-                if nest.operation_info.status != OperationStatus.IDLE:
+            for nest_id, busy in enumerate(self._busy):
+                if busy:
+                    nest = self._nest_slots[nest_id]
                     active_ops.append(
                         {
                             "nest_id": nest.nest_id,
@@ -303,8 +386,9 @@ class BravoDeckState:
         """Get all nests that have labware"""
         with self._lock:
             labware_nests = []
-            for nest in self.nests.values():
-                if nest.labware_type != LabwareType.EMPTY:
+            for nest_id, labware_type in enumerate(self._labware_types):
+                if labware_type is not None and labware_type != LabwareType.EMPTY:
+                    nest = self._nest_slots[nest_id]
                     labware_nests.append(
                         {
                             "nest_id": nest.nest_id,
@@ -318,9 +402,7 @@ class BravoDeckState:
         """Get all nest IDs that have tips loaded"""
         with self._lock:
             return [
-                nest.nest_id
-                for nest in self.nests.values()
-                if nest.tip_info.tips_loaded
+                nest_id for nest_id, loaded in enumerate(self._tips_loaded) if loaded
             ]
 
     def get_deck_summary(self) -> Dict[str, Any]:
@@ -334,9 +416,10 @@ class BravoDeckState:
                     "error_count": self.error_count,
                     "last_error": self.last_error,
                 },
-                "active_operations": len(self.get_active_operations()),
-                "nests_with_labware": len(self.get_nests_with_labware()),
-                "nests_with_tips": len(self.get_nests_with_tips()),
+                "active_operations": self._busy.count(1),
+                "nests_with_labware": self.num_nests
+                - self._labware_types.count(LabwareType.EMPTY),
+                "nests_with_tips": self._tips_loaded.count(1),
                 "nests": {
                     nest_id: nest.get_summary() for nest_id, nest in self.nests.items()
                 },
@@ -350,7 +433,7 @@ class BravoDeckState:
             self.global_operation_count = 0
             self.error_count = 0
             self.last_error = None
-            logging.info("All nests reset to empty state")
+            logger.info("All nests reset to empty state")
 
     def log_error(self, error_message: str, nest_id: int = None):
         """Log an error and update error tracking"""
@@ -363,11 +446,12 @@ class BravoDeckState:
                 self.nests[nest_id].operation_info.operation_details[
                     "error"
                 ] = error_message
+                self._sync_nest_columns(self.nests[nest_id])
 
-            logging.error(
-                f"Deck Error: {error_message}"
-                + (f" (Nest {nest_id})" if nest_id else "")
-            )
+            if nest_id:
+                logger.error("Deck Error: %s (Nest %s)", error_message, nest_id)
+            else:
+                logger.error("Deck Error: %s", error_message)
 
     def export_state_to_dict(self) -> Dict[str, Any]:
         """Export complete state for serialization"""
@@ -381,22 +465,13 @@ class BravoDeckState:
     def find_empty_nests(self) -> List[int]:
         """Find all empty nest positions"""
         with self._lock:
-            return [
-                nest.nest_id
-                for nest in self.nests.values()
-                if nest.labware_type == LabwareType.EMPTY
-            ]
+            return sorted(self._by_type[LabwareType.EMPTY])
 
     def find_nests_by_labware_type(self, labware_type: str) -> List[int]:
         """Find nests containing specific labware type"""
         with self._lock:
             try:
-                target_type = LabwareType(labware_type.lower())
-                return [
-                    nest.nest_id
-                    for nest in self.nests.values()
-                    if nest.labware_type == target_type
-                ]
+                return sorted(self._by_type[LabwareType(labware_type.lower())])
             except ValueError:
-                logging.error(f"Unknown labware type: {labware_type}")
+                logger.error("Unknown labware type: %s", labware_type)
                 return []
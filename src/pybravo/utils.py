@@ -1,5 +1,3 @@
-import ctypes
-import sys
 import os
 
 
@@ -9,7 +7,10 @@ def is_admin():
         if os.name != "nt":
             return False
 
-        # Use ctypes to call Windows API
+        # Use ctypes to call Windows API; imported here since only hardware
+        # drivers on Windows ever need it
+        import ctypes
+
         return ctypes.windll.shell32.IsUserAnAdmin()
     except:
         # If any error occurs, assume not admin
@@ -25,6 +25,27 @@ try:
 except ImportError:
     HAS_WEBSOCKETS = False
 
+# orjson is optional and encodes operation messages faster than json
+try:
+    import orjson
+
+    def _json_dumps(message: Dict[str, Any]) -> str:
+        # Deck summaries key nests by int id, which orjson rejects by default
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# uvloop is optional and not available on Windows
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 
 class VisualizerMixin:
     """Enhanced mixin to add visualization capabilities with state management integration"""
@@ -39,6 +60,8 @@ class VisualizerMixin:
         self._ws_client = None
         self._ws_loop = None
         self._ws_thread = None
+        # Set once the first connection attempt has connected or given up
+        self._ws_ready = threading.Event()
 
         if self.with_visualizer:
             self._start_visualizer_connection()
@@ -47,14 +70,18 @@ class VisualizerMixin:
         """Start WebSocket client in background thread"""
 
         def run_client():
-            loop = asyncio.new_event_loop()
+            loop = _new_event_loop()
             asyncio.set_event_loop(loop)
             self._ws_loop = loop
-            loop.run_until_complete(self._connect_to_visualizer())
+            try:
+                loop.run_until_complete(self._connect_to_visualizer())
+            finally:
+                self._ws_ready.set()
 
         self._ws_thread = threading.Thread(target=run_client, daemon=True)
         self._ws_thread.start()
-        time.sleep(2)  # Give more time for connection to establish
+        # Wait up to 2s for the connection, returning as soon as it is up
+        self._ws_ready.wait(timeout=2)
 
     async def _connect_to_visualizer(self):
         """Connect to visualizer server"""
@@ -65,7 +92,9 @@ class VisualizerMixin:
             try:
                 uri = f"ws://localhost:{self.visualizer_port}"
                 logger.info(
-                    f"Attempting to connect to visualizer at {uri} (attempt {retry_count + 1})"
+                    "Attempting to connect to visualizer at %s (attempt %s)",
+                    uri,
+                    retry_count + 1,
                 )
 
                 async with websockets.connect(uri, ping_interval=None) as websocket:
@@ -74,6 +103,7 @@ class VisualizerMixin:
 
                     # Send initial state sync
                     await self._sync_state_to_visualizer()
+                    self._ws_ready.set()
 
                     # Keep connection alive
                     try:
@@ -83,12 +113,18 @@ class VisualizerMixin:
                     except websockets.exceptions.ConnectionClosed:
                         logger.info("Visualizer connection closed")
                         break
+                    finally:
+                        # Later sends see no client and return early instead
+                        # of raising ConnectionClosed through a future each time
+                        self._ws_client = None
 
             except (ConnectionRefusedError, OSError) as e:
                 retry_count += 1
                 if retry_count < max_retries:
                     logger.info(
-                        f"Visualizer not ready, retrying in 2s... ({retry_count}/{max_retries})"
+                        "Visualizer not ready, retrying in 2s... (%s/%s)",
+                        retry_count,
+                        max_retries,
                     )
                     await asyncio.sleep(2)
                 else:
@@ -97,17 +133,17 @@ class VisualizerMixin:
                     )
                     break
             except Exception as e:
-                logger.error(f"Visualizer connection error: {e}")
+                logger.error("Visualizer connection error: %s", e)
                 break
 
     async def _handle_visualizer_message(self, message: str):
         """Handle incoming messages from visualizer"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             # Handle any commands from the visualizer if needed
-            logger.debug(f"Received from visualizer: {data}")
+            logger.debug("Received from visualizer: %s", data)
         except Exception as e:
-            logger.error(f"Error handling visualizer message: {e}")
+            logger.error("Error handling visualizer message: %s", e)
 
     async def _sync_state_to_visualizer(self):
         """Sync current deck state to visualizer"""
@@ -124,11 +160,11 @@ class VisualizerMixin:
                 "timestamp": time.time(),
             }
 
-            await self._ws_client.send(json.dumps(sync_message))
+            await self._ws_client.send(_json_dumps(sync_message))
             logger.info("Synced deck state to visualizer")
 
         except Exception as e:
-            logger.error(f"Error syncing state to visualizer: {e}")
+            logger.error("Error syncing state to visualizer: %s", e)
 
     def _send_to_visualizer(
         self,
@@ -144,8 +180,9 @@ class VisualizerMixin:
 
         # Get current nest state for additional context
         nest_state = None
-        if hasattr(self, "deck_state") and self.deck_state:
-            nest = self.deck_state.get_nest(position)
+        deck_state = getattr(self, "deck_state", None)
+        if deck_state:
+            nest = deck_state.get_nest(position)
             if nest:
                 nest_state = {
                     "labware_type": nest.labware_type.value,
@@ -172,11 +209,11 @@ class VisualizerMixin:
 
         try:
             future = asyncio.run_coroutine_threadsafe(
-                self._ws_client.send(json.dumps(message)), self._ws_loop
+                self._ws_client.send(_json_dumps(message)), self._ws_loop
             )
             future.result(timeout=0.5)  # Slightly longer timeout
         except Exception as e:
-            logger.debug(f"Failed to send to visualizer: {e}")
+            logger.debug("Failed to send to visualizer: %s", e)
 
 
 def visualizer_method(operation_name: str):
@@ -185,19 +222,19 @@ def visualizer_method(operation_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            # Extract parameters before calling the method
-            operation_params = extract_operation_params(operation_name, args, kwargs)
-
             # Call original method first
             result = func(self, *args, **kwargs)
 
             # Send to visualizer after successful execution
-            if hasattr(self, "with_visualizer") and self.with_visualizer:
+            if getattr(self, "with_visualizer", False):
+                operation_params = extract_operation_params(
+                    operation_name, args, kwargs
+                )
                 try:
                     if operation_params:
                         self._send_to_visualizer(**operation_params)
                 except Exception as e:
-                    logger.debug(f"Visualization failed for {operation_name}: {e}")
+                    logger.debug("Visualization failed for %s: %s", operation_name, e)
 
             return result
 
@@ -250,7 +287,7 @@ def extract_operation_params(
 
             return {"operation": operation_name, "position": position, "volume": volume}
     except Exception as e:
-        logger.debug(f"Error extracting params for {operation_name}: {e}")
+        logger.debug("Error extracting params for %s: %s", operation_name, e)
 
     return None
 
@@ -334,7 +371,7 @@ class BravoDriverWithVisualization(VisualizerMixin, BravoDriver):
                 future.result(timeout=1.0)
                 logger.info("Manual state sync to visualizer completed")
             except Exception as e:
-                logger.error(f"Manual state sync failed: {e}")
+                logger.error("Manual state sync failed: %s", e)
 
     def set_labware_with_visualization(
         self, nest_id: int, labware_type: str, labware_name: str = None
@@ -370,15 +407,22 @@ def start_enhanced_visualizer_server(
 ):
     """Helper to start enhanced visualizer server with state integration"""
     try:
-        from .enhanced_visualizer_server import BravoDeckVisualizerWithState
+        from .deck_visualizer.visualizer_server import BravoDeckVisualizerWithState
 
         def run_server():
             visualizer = BravoDeckVisualizerWithState(
                 port=port, bravo_driver=bravo_driver
             )
-            asyncio.run(
-                visualizer.start(run_demo=demo, serve_files=True, http_port=http_port)
-            )
+            loop = _new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(
+                    visualizer.start(
+                        run_demo=demo, serve_files=True, http_port=http_port
+                    )
+                )
+            finally:
+                loop.close()
 
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
@@ -387,13 +431,13 @@ def start_enhanced_visualizer_server(
         logger.info("🚀 Starting enhanced visualizer server with state integration...")
         time.sleep(3)
         logger.info("🌐 Enhanced visualizer server started - check your browser!")
-        logger.info(f"📡 WebSocket server: ws://localhost:{port}")
-        logger.info(f"🌐 Web interface: http://localhost:{http_port}")
+        logger.info("📡 WebSocket server: ws://localhost:%s", port)
+        logger.info("🌐 Web interface: http://localhost:%s", http_port)
         logger.info("🔄 State synchronization enabled")
         return True
 
     except Exception as e:
-        logger.warning(f"Could not start enhanced visualizer server: {e}")
+        logger.warning("Could not start enhanced visualizer server: %s", e)
         return False
 
 
@@ -454,13 +498,13 @@ def demo_enhanced_integration():
         logger.info("Final deck state:")
         deck_summary = bravo.get_deck_summary()
         logger.info(
-            f"Total operations: {deck_summary['deck_info']['global_operation_count']}"
+            "Total operations: %s", deck_summary["deck_info"]["global_operation_count"]
         )
-        logger.info(f"Labware count: {len(bravo.get_nests_with_labware())}")
+        logger.info("Labware count: %s", len(bravo.get_nests_with_labware()))
 
         # Show visualization status
         vis_status = bravo.get_visualization_status()
-        logger.info(f"Visualization status: {vis_status}")
+        logger.info("Visualization status: %s", vis_status)
 
         logger.info("Demo complete! Check the web interface for visual updates.")
 
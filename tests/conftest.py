@@ -2,20 +2,109 @@
 Pytest configuration and fixtures
 """
 
+import threading
+import time
+from types import SimpleNamespace
+
 import pytest
-from pybravo import BravoDriver
+from pybravo import BravoDriver, core
 
 
 @pytest.fixture
 def controller():
-    """Create a driver instance for testing"""
+    """Create an unconnected hardware driver instance for testing"""
     return BravoDriver()
 
 
 @pytest.fixture
 def connected_controller():
-    """Create a connected BravoController instance for testing"""
-    controller = BravoDriver()
-    # Mock connection for testing
-    controller._connected = True
+    """Create a connected driver for testing, simulating the device"""
+    controller = BravoDriver(simulation_mode=True)
+    controller.connect()
     return controller
+
+
+class FakeComEvent:
+    """Stand-in for a .NET event: supports ``+=`` and firing its handlers"""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def fire(self):
+        for handler in self.handlers:
+            handler(None, None)
+
+
+class FakeControl:
+    """Stubbed Bravo control recording which thread each COM call runs on
+
+    Non-blocking commands never complete on their own; tests fire the
+    matching ``<Name>Complete`` event, or abort them.
+    """
+
+    def __init__(self):
+        self.Blocking = True
+        self.calls = []
+        self.started = threading.Event()
+        self.Error = FakeComEvent()
+        for com_method in core._COMPLETION_EVENTS:
+            setattr(self, f"{com_method}Complete", FakeComEvent())
+
+    def CreateControl(self):
+        pass
+
+    def GetOcx(self):
+        raise TypeError("no interop assembly")
+
+    def __getattr__(self, name):
+        if not name[:1].isupper():
+            raise AttributeError(name)
+
+        def com_method(*args):
+            self.calls.append((name, threading.get_ident()))
+            self.started.set()
+            return None
+
+        return com_method
+
+
+@pytest.fixture
+def fake_com(monkeypatch):
+    """Run hardware drivers against FakeControl on a real STA worker thread"""
+
+    def wait(handles, wait_all, timeout_ms, mask):
+        timeout = None if timeout_ms == win32event.INFINITE else timeout_ms / 1000
+        if handles and handles[0].wait(timeout):
+            handles[0].clear()
+        elif not handles:
+            time.sleep(timeout)
+
+    win32event = SimpleNamespace(
+        INFINITE=-1,
+        QS_ALLINPUT=0xFF,
+        CreateEvent=lambda *args: threading.Event(),
+        SetEvent=lambda event: event.set(),
+        MsgWaitForMultipleObjects=wait,
+    )
+    pythoncom = SimpleNamespace(
+        COINIT_APARTMENTTHREADED=2,
+        CoInitializeEx=lambda flags: None,
+        CoUninitialize=lambda: None,
+        PumpWaitingMessages=lambda: 0,
+    )
+    controls = []
+
+    def make_control():
+        control = FakeControl()
+        controls.append(control)
+        return control
+
+    monkeypatch.setattr(core, "win32event", win32event)
+    monkeypatch.setattr(core, "pythoncom", pythoncom)
+    monkeypatch.setattr(core, "AxHomewood", make_control)
+    yield controls
+    BravoDriver.release_shared_control()
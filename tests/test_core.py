@@ -1,6 +1,14 @@
+import ast
+import inspect
+import threading
+
 import pytest
-from pybravo import BravoDriver
-from pybravo.exceptions import BravoConnectionError, BravoCommandError
+from pybravo import BravoDriver, core
+from pybravo.exceptions import (
+    BravoConnectionError,
+    BravoCommandError,
+    BravoTimeoutError,
+)
 
 
 class TestBravoDriver:
@@ -15,14 +23,15 @@ class TestBravoDriver:
 
     def test_init_with_params(self):
         """Test controller initialization with parameters"""
-        controller = BravoDriver(port="/dev/ttyUSB0", timeout=60.0)
-        assert controller.port == "/dev/ttyUSB0"
+        controller = BravoDriver(profile="Default", timeout=60.0, blocking=False)
+        assert controller.profile == "Default"
         assert controller.timeout == 60.0
+        assert controller.blocking is False
 
-    def test_connect(self, controller):
+    def test_connect(self, controller, fake_com):
         """Test connection to device"""
         result = controller.connect()
-        assert result is True
+        assert result is None
         assert controller.is_connected()
 
     def test_disconnect(self, connected_controller):
@@ -31,59 +40,298 @@ class TestBravoDriver:
         connected_controller.disconnect()
         assert not connected_controller.is_connected()
 
-    def test_get_status_connected(self, connected_controller):
-        """Test getting status when connected"""
-        status = connected_controller.get_status()
-        assert isinstance(status, dict)
-        assert "status" in status
-        assert "position" in status
-        assert "temperature" in status
+    def test_get_deck_summary_connected(self, connected_controller):
+        """Test getting the deck summary when connected"""
+        summary = connected_controller.get_deck_summary()
+        assert isinstance(summary, dict)
+        assert "deck_info" in summary
+        assert "nests" in summary
+        assert "nests_with_tips" in summary
 
-    def test_get_status_not_connected(self, controller):
-        """Test getting status when not connected"""
+    def test_query_not_connected(self, controller):
+        """Test querying the device when not connected"""
         with pytest.raises(BravoCommandError, match="Device not connected"):
-            controller.get_status()
+            controller.get_firmware_version()
 
-    def test_move_to_connected(self, connected_controller):
-        """Test moving to position when connected"""
+    def test_move_to_location_connected(self, connected_controller):
+        """Test moving to a location when connected"""
         # Should not raise an exception
-        connected_controller.move_to(10.0, 20.0, 30.0)
-        connected_controller.move_to(10.0, 20.0)  # Without Z
+        connected_controller.move_to_location(3)
+        connected_controller.move_to_location(3, only_z=True)
 
-    def test_move_to_not_connected(self, controller):
+    def test_move_to_location_not_connected(self, controller):
         """Test moving when not connected"""
         with pytest.raises(BravoCommandError, match="Device not connected"):
-            controller.move_to(10.0, 20.0)
+            controller.move_to_location(3)
 
     def test_aspirate_valid(self, connected_controller):
         """Test aspiration with valid parameters"""
-        connected_controller.aspirate(100.0)
-        connected_controller.aspirate(50.0, speed=10.0)
+        connected_controller.aspirate(100.0, 2)
+        connected_controller.aspirate(50.0, 2, distance_from_well_bottom=1.0)
 
     def test_aspirate_invalid_volume(self, connected_controller):
         """Test aspiration with invalid volume"""
         with pytest.raises(BravoCommandError, match="Volume must be positive"):
-            connected_controller.aspirate(-10.0)
+            connected_controller.aspirate(-10.0, 2)
 
         with pytest.raises(BravoCommandError, match="Volume must be positive"):
-            connected_controller.aspirate(0.0)
+            connected_controller.aspirate(0.0, 2)
 
     def test_aspirate_not_connected(self, controller):
         """Test aspiration when not connected"""
         with pytest.raises(BravoCommandError, match="Device not connected"):
-            controller.aspirate(100.0)
+            controller.aspirate(100.0, 2)
 
     def test_dispense_valid(self, connected_controller):
         """Test dispensing with valid parameters"""
-        connected_controller.dispense(100.0)
-        connected_controller.dispense(50.0, speed=10.0)
+        connected_controller.dispense(100.0, plate_location=3)
+        connected_controller.dispense(50.0, blow_out_volume=5.0, plate_location=3)
 
     def test_dispense_invalid_volume(self, connected_controller):
         """Test dispensing with invalid volume"""
         with pytest.raises(BravoCommandError, match="Volume must be positive"):
-            connected_controller.dispense(-10.0)
+            connected_controller.dispense(-10.0, plate_location=3)
 
     def test_dispense_not_connected(self, controller):
         """Test dispensing when not connected"""
         with pytest.raises(BravoCommandError, match="Device not connected"):
-            controller.dispense(100.0)
+            controller.dispense(100.0, plate_location=3)
+
+    def test_no_duplicate_methods(self):
+        """Test that no method is defined twice in the class body"""
+        tree = ast.parse(inspect.getsource(inspect.getmodule(BravoDriver)))
+        cls = next(
+            node
+            for node in tree.body
+            if isinstance(node, ast.ClassDef) and node.name == "BravoDriver"
+        )
+        names = [
+            node.name
+            for node in cls.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        assert len(names) == len(set(names))
+
+    def test_homing_runs_on_sta_worker(self, fake_com):
+        """Test that homing methods run on the STA worker, not the caller"""
+        driver = BravoDriver(enable_state_tracking=False)
+        driver.connect()
+        driver.home_w()
+        driver.home_xyz()
+
+        worker_ident = driver._worker.ident
+        calls = dict(fake_com[0].calls)
+        assert calls["HomeW"] == worker_ident
+        assert calls["HomeXYZ"] == worker_ident
+        assert worker_ident != threading.get_ident()
+
+    def test_abort_interrupts_running_command(self, fake_com):
+        """Test that abort reaches the device while a command is in flight"""
+        driver = BravoDriver(blocking=False, enable_state_tracking=False)
+        driver.connect()
+        control = fake_com[0]
+
+        # Wash never raises WashComplete on the fake, so it runs until aborted
+        running = driver.submit_async(driver.wash, 100.0, False, 0.0, 0.0, 3, 2)
+        assert control.started.wait(1.0)
+
+        driver.abort()
+
+        assert [name for name, _ in control.calls] == ["Wash", "Abort"]
+        with pytest.raises(BravoCommandError, match="aborted"):
+            running.result(timeout=1.0)
+
+    def test_nonblocking_command_times_out(self, fake_com):
+        """Test that a missing Complete event fails the command after its timeout"""
+        driver = BravoDriver(blocking=False, enable_state_tracking=False, timeout=0.2)
+        driver.connect()
+        control = fake_com[0]
+
+        running = driver.submit_async(driver.wash, 100.0, False, 0.0, 0.0, 3, 2)
+        assert control.started.wait(1.0)
+        # A stale event for another command must not finish the wash
+        control.MixComplete.fire()
+
+        with pytest.raises(BravoTimeoutError, match="Wash"):
+            running.result(timeout=2.0)
+        # The device is stopped before the next command can be sent
+        assert [name for name, _ in control.calls] == ["Wash", "Abort"]
+
+    def test_get_nest_state_is_fresh(self, connected_controller):
+        """Test that nest state reflects the deck and is not shared between calls"""
+        first = connected_controller.get_nest_state(2)
+        first["tips_loaded"] = "corrupted"
+        assert connected_controller.get_nest_state(2)["tips_loaded"] is False
+
+        # Changes made directly on the deck state are visible immediately
+        connected_controller.deck_state.update_tips_at_nest(2, True)
+        assert connected_controller.get_nest_state(2)["tips_loaded"] is True
+
+    def test_prepare_aspirate(self, connected_controller):
+        """Test that a prepared aspirate repeats the same command"""
+        aspirate = connected_controller.prepare_aspirate(10, 2)
+        aspirate()
+        aspirate()
+
+        expected = ("aspirate", (10.0, 2, 0.0, 0.0, 0.0, 0.0), {})
+        assert connected_controller.get_simulation_commands() == [expected] * 2
+        assert connected_controller.get_nest_state(2)["current_volume"] == 20.0
+
+    def test_prepare_dispense(self, connected_controller):
+        """Test that a prepared dispense repeats the same command"""
+        dispense = connected_controller.prepare_dispense(5, plate_location=3)
+        dispense()
+        dispense()
+
+        expected = ("dispense", (5.0, False, 0.0, 3, 0.0, 0.0), {})
+        assert connected_controller.get_simulation_commands() == [expected] * 2
+        # plate_location is passed by keyword so state tracking finds the nest
+        nest = connected_controller.deck_state.get_nest(3)
+        assert nest.volume_info.dispensed_volume == 10.0
+
+    def test_prepare_aspirate_validates_on_call(self, connected_controller):
+        """Test that a prepared aspirate still rejects invalid volumes"""
+        aspirate = connected_controller.prepare_aspirate(0, 2)
+        with pytest.raises(BravoCommandError):
+            aspirate()
+
+    def test_get_simulation_commands(self, connected_controller):
+        """Test that simulated commands are recorded in order"""
+        connected_controller.tips_on(1)
+        connected_controller.move_to_location(4)
+        connected_controller.home_w()
+
+        commands = connected_controller.get_simulation_commands()
+        assert [name for name, _, _ in commands] == [
+            "tips_on",
+            "move_to_location",
+            "home_w",
+        ]
+        assert commands[0] == ("tips_on", (1,), {})
+
+        # The returned list is a copy
+        commands.clear()
+        assert len(connected_controller.get_simulation_commands()) == 3
+
+        connected_controller.clear_simulation_commands()
+        assert connected_controller.get_simulation_commands() == []
+
+    def test_simulation_commands_are_bounded(self, monkeypatch):
+        """Test that only the most recent simulated commands are kept"""
+        monkeypatch.setattr(core, "SIM_COMMAND_HISTORY", 3)
+        driver = BravoDriver(simulation_mode=True)
+        driver.connect()
+        for location in range(5):
+            driver.move_to_location(location)
+
+        commands = driver.get_simulation_commands()
+        assert [args for _, args, _ in commands] == [(2,), (3,), (4,)]
+
+    def test_simulation_commands_empty_on_hardware(self, controller):
+        """Test that a hardware driver records no simulated commands"""
+        assert controller.get_simulation_commands() == []
+
+
+class TestCommandBatch:
+    """Test cases for CommandBatch, batch(), script() and run_batch()"""
+
+    def test_batch_flushes_at_max_size(self, connected_controller):
+        """Test that a batch runs its commands once max_size are queued"""
+        with connected_controller.batch(max_size=2) as batch:
+            batch.tips_on(1)
+            assert len(batch) == 1
+            assert connected_controller.get_simulation_commands() == []
+
+            batch.aspirate(10, 2)
+            assert len(batch) == 0
+            assert len(connected_controller.get_simulation_commands()) == 2
+
+            batch.dispense(10, plate_location=3)
+            assert len(batch) == 1
+
+        commands = connected_controller.get_simulation_commands()
+        assert [name for name, _, _ in commands] == ["tips_on", "aspirate", "dispense"]
+        assert batch.results == [None, None, None]
+
+    def test_batch_flushes_urgent_commands(self, connected_controller):
+        """Test that homing is never left waiting in the queue"""
+        with connected_controller.batch() as batch:
+            batch.tips_on(1)
+            batch.home_w()
+            assert len(batch) == 0
+            commands = connected_controller.get_simulation_commands()
+            assert [name for name, _, _ in commands] == ["tips_on", "home_w"]
+
+    def test_batch_custom_should_execute(self, connected_controller):
+        """Test that should_execute decides which commands flush the batch"""
+
+        def flush_on_dispense(name, args, kwargs):
+            return name == "dispense"
+
+        with connected_controller.batch(should_execute=flush_on_dispense) as batch:
+            batch.aspirate(10, 2)
+            batch.home_w()
+            assert len(batch) == 2
+            batch.dispense(10, plate_location=3)
+            assert len(batch) == 0
+
+    def test_batch_discards_pending_on_error(self, connected_controller):
+        """Test that queued commands do not run after the batch body fails"""
+        with pytest.raises(RuntimeError):
+            with connected_controller.batch() as batch:
+                batch.tips_on(1)
+                raise RuntimeError("protocol error")
+
+        assert len(batch) == 0
+        assert connected_controller.get_simulation_commands() == []
+
+    def test_batch_rejects_unknown_command(self, connected_controller):
+        """Test that a misspelled command fails when it is queued"""
+        batch = connected_controller.batch()
+        with pytest.raises(AttributeError):
+            batch.aspirat(10, 2)
+        with pytest.raises(AttributeError):
+            batch._run_on_sta
+
+    def test_batch_rejects_invalid_max_size(self, connected_controller):
+        """Test that max_size must be positive"""
+        with pytest.raises(ValueError):
+            connected_controller.batch(max_size=0)
+
+    def test_script_runs_on_exit(self, connected_controller):
+        """Test that a script holds every command, urgent ones included"""
+        with connected_controller.script() as script:
+            script.tips_on(1)
+            script.home_w()
+            script.aspirate(10, 2)
+            assert len(script) == 3
+            assert connected_controller.get_simulation_commands() == []
+
+        commands = connected_controller.get_simulation_commands()
+        assert [name for name, _, _ in commands] == ["tips_on", "home_w", "aspirate"]
+        assert len(script.results) == 3
+
+    def test_run_batch_stops_at_first_failure(self, connected_controller):
+        """Test that run_batch runs in order and stops at the first error"""
+        ops = [
+            ("aspirate", (10, 2), {}),
+            ("aspirate", (-1, 2), {}),
+            ("dispense", (10,), {"plate_location": 3}),
+        ]
+        with pytest.raises(BravoCommandError):
+            connected_controller.run_batch(ops)
+
+        commands = connected_controller.get_simulation_commands()
+        assert [name for name, _, _ in commands] == ["aspirate"]
+
+    def test_run_batch_runs_on_sta_worker(self, fake_com):
+        """Test that a batch runs every command on the STA worker"""
+        driver = BravoDriver(enable_state_tracking=False)
+        driver.connect()
+
+        results = driver.run_batch([("home_w", (), {}), ("home_xyz", (), {})])
+
+        assert len(results) == 2
+        worker_ident = driver._worker.ident
+        assert [name for name, _ in fake_com[0].calls] == ["HomeW", "HomeXYZ"]
+        assert {ident for _, ident in fake_com[0].calls} == {worker_ident}
@@ -0,0 +1,93 @@
+from dataclasses import asdict
+
+from pybravo.state import BravoDeckState, OperationStatus
+
+
+class TestBravoDeckState:
+    """Test cases for BravoDeckState"""
+
+    def test_find_nests_by_labware_type(self):
+        """Test that lookups by labware type follow labware changes"""
+        deck = BravoDeckState()
+        deck.set_labware_at_nest(2, "microplate_96")
+        deck.set_labware_at_nest(5, "MICROPLATE_96")
+        deck.set_labware_at_nest(7, "reservoir")
+        assert deck.find_nests_by_labware_type("microplate_96") == [2, 5]
+        assert deck.find_nests_by_labware_type("reservoir") == [7]
+
+        # Replacing labware moves the nest between types
+        deck.set_labware_at_nest(2, "reservoir")
+        assert deck.find_nests_by_labware_type("microplate_96") == [5]
+        assert deck.find_nests_by_labware_type("reservoir") == [2, 7]
+        assert deck.find_empty_nests() == [1, 3, 4, 6, 8, 9]
+
+        deck.reset_all_nests()
+        assert deck.find_nests_by_labware_type("reservoir") == []
+        assert deck.find_empty_nests() == list(range(1, 10))
+
+    def test_find_nests_by_unknown_labware_type(self):
+        """Test that unrecognised labware is indexed as unknown"""
+        deck = BravoDeckState()
+        deck.set_labware_at_nest(4, "not_a_plate")
+        assert deck.find_nests_by_labware_type("unknown") == [4]
+        assert deck.find_nests_by_labware_type("not_a_plate") == []
+
+    def test_queries_follow_nest_changes(self):
+        """Test that deck queries reflect changes made through the deck"""
+        deck = BravoDeckState()
+        deck.set_labware_at_nest(1, "tip_rack")
+        deck.update_tips_at_nest(3, True)
+        deck.start_operation_at_nest(4, "aspirating", {"volume": 10})
+
+        assert deck.get_nests_with_tips() == [3]
+        assert [n["nest_id"] for n in deck.get_nests_with_labware()] == [1]
+        active = deck.get_active_operations()
+        assert [(op["nest_id"], op["operation"]) for op in active] == [
+            (4, "aspirating")
+        ]
+
+        summary = deck.get_deck_summary()
+        assert summary["active_operations"] == 1
+        assert summary["nests_with_labware"] == 1
+        assert summary["nests_with_tips"] == 1
+
+        deck.complete_operation_at_nest(4)
+        deck.update_tips_at_nest(3, False)
+        summary = deck.get_deck_summary()
+        assert summary["active_operations"] == 0
+        assert summary["nests_with_tips"] == 0
+        assert deck.get_active_operations() == []
+
+    def test_queries_follow_nest_methods(self):
+        """Test that changes made on a Nest directly keep the deck in sync"""
+        deck = BravoDeckState()
+        nest = deck.get_nest(6)
+        nest.update_tips(True)
+        nest.start_operation(OperationStatus.MIXING)
+        nest.update_volume(aspirated=25.0)
+
+        assert deck.get_nests_with_tips() == [6]
+        assert deck.get_active_operations()[0]["nest_id"] == 6
+        assert deck.get_deck_summary()["nests"][6]["current_volume"] == 25.0
+
+    def test_change_listener(self):
+        """Test that listeners receive the ID of every changed nest"""
+        deck = BravoDeckState()
+        changed = []
+        deck.add_change_listener(changed.append)
+
+        deck.set_labware_at_nest(2, "microplate_96")
+        deck.update_volume_at_nest(8, aspirated=5.0)
+        assert changed == [2, 8]
+
+    def test_invalid_nest_id(self):
+        """Test that out-of-range nest IDs are rejected"""
+        deck = BravoDeckState()
+        assert deck.get_nest(0) is None
+        assert deck.get_nest(10) is None
+        assert deck.set_labware_at_nest(10, "reservoir") is False
+
+    def test_nest_serialization_skips_callback(self):
+        """Test that the change callback is not part of a nest's fields"""
+        deck = BravoDeckState()
+        assert "_on_change" not in asdict(deck.get_nest(1))
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from pybravo.deck_visualizer import visualizer_server
+from pybravo.deck_visualizer.visualizer_server import BravoDeckVisualizerWithState
+
+
+class FakeClient:
+    """Stand-in for a websocket connection that records sent frames"""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, frame):
+        self.frames.append(frame)
+
+
+@pytest.fixture
+def fake_broadcast(monkeypatch):
+    """Deliver websockets.broadcast frames to FakeClient instances"""
+
+    def broadcast(clients, frame):
+        for client in clients:
+            client.frames.append(frame)
+
+    monkeypatch.setattr(visualizer_server.websockets, "broadcast", broadcast)
+
+
+async def connect_client(visualizer):
+    """Register a FakeClient and drop the snapshot it is sent on connect"""
+    client = FakeClient()
+    await visualizer.register_client(client)
+    client.frames.clear()
+    return client
+
+
+class TestVisualizerServer:
+    """Test cases for BravoDeckVisualizerWithState"""
+
+    def test_start_from_worker_thread(self):
+        """Test that the embedded server starts on a loop off the main thread"""
+        visualizer = BravoDeckVisualizerWithState(port=0, animation_delay=0)
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(visualizer.start())
+        errors = []
+
+        def run_server():
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=run_server, daemon=True)
+        thread.start()
+
+        async def first_message():
+            # The server picks its port once started; retry until it listens
+            for _ in range(50):
+                if visualizer.port:
+                    try:
+                        uri = f"ws://localhost:{visualizer.port}"
+                        async with websockets.connect(uri) as ws:
+                            return json.loads(await ws.recv())
+                    except OSError:
+                        pass
+                await asyncio.sleep(0.05)
+            raise AssertionError(f"server never listened: {errors}")
+
+        try:
+            message = asyncio.run(first_message())
+        finally:
+            loop.call_soon_threadsafe(task.cancel)
+            thread.join(5.0)
+
+        assert errors == []
+        assert message["type"] == "deck_update"
+
+    def test_patch_contains_only_changes(self, fake_broadcast):
+        """Test that a deck patch carries only the changed nest fields"""
+        visualizer = BravoDeckVisualizerWithState(animation_delay=0)
+
+        async def scenario():
+            client = await connect_client(visualizer)
+            await visualizer.send_deck_update()
+            visualizer.deck_state.set_labware_at_nest(4, "reservoir", "Buffer")
+            await visualizer.send_deck_update()
+            # Nothing changed since the patch, so nothing is sent
+            await visualizer.send_deck_update()
+            return client.frames
+
+        frames = asyncio.run(scenario())
+
+        assert len(frames) == 2
+        assert json.loads(frames[0])["type"] == "deck_update"
+        patch = json.loads(frames[1])
+        assert patch["type"] == "deck_patch"
+        assert patch["changes"] == {
+            "4": {"labware": "reservoir", "labware_name": "Buffer"}
+        }
+        assert patch["state_info"]["nests_with_labware"] == 1
+
+    def test_targeted_snapshot_matches_last_broadcast(self, fake_broadcast):
+        """Test that a client's snapshot is exactly the deck others hold"""
+        visualizer = BravoDeckVisualizerWithState(animation_delay=0)
+
+        async def scenario():
+            other = await connect_client(visualizer)
+            await visualizer.send_deck_update()
+            # Changed but not yet broadcast when the snapshot is requested
+            visualizer.deck_state.update_tips_at_nest(6, True)
+            client = await connect_client(visualizer)
+            await visualizer.send_deck_update(client)
+            return other.frames, client.frames
+
+        other_frames, client_frames = asyncio.run(scenario())
+
+        deck, state_info = visualizer._last_broadcast
+        snapshot = json.loads(client_frames[-1])
+        assert snapshot["type"] == "deck_update"
+        assert snapshot["deck"] == json.loads(json.dumps(deck))
+        assert snapshot["deck"]["6"]["tips_loaded"] is True
+        assert snapshot["state_info"] == state_info
+        # Existing clients got the change as a patch first
+        patch = json.loads(other_frames[-1])
+        assert patch["changes"] == {"6": {"tips_loaded": True}}
+
+    def test_msgpack_and_json_clients(self, fake_broadcast):
+        """Test that msgpack clients get binary frames and JSON clients text"""
+        msgpack = pytest.importorskip("msgpack")
+        visualizer = BravoDeckVisualizerWithState(animation_delay=0)
+
+        async def scenario():
+            binary_client = await connect_client(visualizer)
+            text_client = await connect_client(visualizer)
+            await visualizer.handle_client_message(
+                binary_client,
+                json.dumps({"command": "set_format", "format": "msgpack"}),
+            )
+            await visualizer.send_deck_update()
+            binary_client.frames.clear()
+            text_client.frames.clear()
+            visualizer.deck_state.set_labware_at_nest(2, "microplate_96")
+            await visualizer.send_deck_update()
+            return binary_client.frames, text_client.frames
+
+        binary_frames, text_frames = asyncio.run(scenario())
+
+        assert len(binary_frames) == 1 and isinstance(binary_frames[0], bytes)
+        assert len(text_frames) == 1 and isinstance(text_frames[0], str)
+        binary = msgpack.unpackb(binary_frames[0], strict_map_key=False)
+        text = json.loads(text_frames[0])
+        assert binary["type"] == text["type"] == "deck_patch"
+        assert binary["changes"] == {2: {"labware": "plate-96"}}
+        assert text["changes"] == {"2": {"labware": "plate-96"}}